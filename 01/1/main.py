@@ -1,4 +1,10 @@
-def solve(input_lines: list[str]):
+from typing import Iterable, Optional, Union
+
+from utils.chunks import map_chunks
+from utils.loader import map_file
+
+
+def solve(input_lines: Iterable[str]):
     total = 0
     for line in input_lines:
         while not line[0].isdigit():
@@ -9,11 +15,33 @@ def solve(input_lines: list[str]):
     return total
 
 
-def main():
-    with open("01/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
+def solve_buffer(data: Union[bytes, memoryview]):
+    # Whole input at once, no str per line: the first and last digit of a line are the digits whose line number
+    # differs from the digit before and after them respectively
+    import numpy as np
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    digits = np.flatnonzero((buffer >= ord("0")) & (buffer <= ord("9")))
+    if not digits.size:
+        return 0
+    lines = np.searchsorted(np.flatnonzero(buffer == ord("\n")), digits)
+    line_changes = lines[1:] != lines[:-1]
+    values = buffer[digits] - ord("0")
+    first = values[np.concatenate(([True], line_changes))]
+    last = values[np.concatenate((line_changes, [True]))]
+    return int(first.sum()) * 10 + int(last.sum())
+
 
-    print(solve(test_input))
+def solve_chunk(path: str, start: int, end: int):
+    return solve_buffer(memoryview(map_file(path))[start:end])
+
+
+def solve_file(path: str, jobs: Optional[int] = None):
+    return sum(map_chunks(__file__, "solve_chunk", path, jobs))
+
+
+def main():
+    print(solve_buffer(map_file("01/input.txt")))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+from main import solve, solve_buffer, solve_file
+
+EXAMPLE = [
+    "1abc2",
+    "pqr3stu8vwx",
+    "a1b2c3d4e5f",
+    "treb7uchet",
+]
+
+
+def test_main():
+    assert solve(EXAMPLE) == 142
+
+
+def test_buffer():
+    assert solve_buffer("\n".join(EXAMPLE).encode()) == 142
+    assert solve_buffer("".join(line + "\r\n" for line in EXAMPLE).encode()) == 142
+    assert solve_buffer(b"") == 0
+    assert solve_buffer(b"abc\n") == 0
+
+
+def test_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("".join(line + "\n" for line in EXAMPLE * 50))
+    assert solve_file(str(path), jobs=2) == 142 * 50
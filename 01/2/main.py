@@ -1,44 +1,110 @@
-def solve(input_lines: list[str]):
-    total = 0
-    digits = {
-        "1": "1",
-        "2": "2",
-        "3": "3",
-        "4": "4",
-        "5": "5",
-        "6": "6",
-        "7": "7",
-        "8": "8",
-        "9": "9",
-        "0": "0",
-        "one": "1",
-        "two": "2",
-        "three": "3",
-        "four": "4",
-        "five": "5",
-        "six": "6",
-        "seven": "7",
-        "eight": "8",
-        "nine": "9",
-        "zero": "0",
-    }
+from collections import deque
+from typing import Iterable, Optional
+
+from utils.chunks import map_chunks
+from utils.loader import iter_lines, map_file, text_lines
+
+DIGITS = {
+    "1": 1,
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+    "0": 0,
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "zero": 0,
+}
+
+
+class Automaton:
+    # Aho-Corasick automaton over a fixed set of patterns, compiled to a full transition table so scanning costs a
+    # single dict lookup per character
+    def __init__(self, patterns: dict[str, int]):
+        goto: list[dict[str, int]] = [{}]
+        # Longest pattern ending in each state as (length, value), that match starts earliest
+        self._output: list[Optional[tuple[int, int]]] = [None]
+        for pattern, value in patterns.items():
+            state = 0
+            for c in pattern:
+                if c not in goto[state]:
+                    goto.append({})
+                    self._output.append(None)
+                    goto[state][c] = len(goto) - 1
+                state = goto[state][c]
+            self._output[state] = (len(pattern), value)
+
+        self.max_length = max(map(len, patterns))
+        alphabet = set("".join(patterns))
+        self._delta: list[dict[str, int]] = [{} for _ in goto]
+        fail = [0] * len(goto)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            for c in alphabet:
+                if c in goto[state]:
+                    child = goto[state][c]
+                    self._delta[state][c] = child
+                    if state:
+                        fail[child] = self._delta[fail[state]][c]
+                        if self._output[child] is None:
+                            self._output[child] = self._output[fail[child]]
+                    queue.append(child)
+                else:
+                    self._delta[state][c] = self._delta[fail[state]][c] if state else 0
+
+    def first_match(self, text: str, positions: Iterable[int]) -> Optional[int]:
+        # Visits text in the order given by positions and returns the value of the match that starts first in that
+        # order. A later, longer match could still start earlier, so scanning goes on for max_length more steps
+        best: Optional[tuple[int, int]] = None
+        state = 0
+        for step, i in enumerate(positions):
+            if best is not None and step >= best[0] + self.max_length:
+                break
+            state = self._delta[state].get(text[i], 0)
+            if (output := self._output[state]) is not None:
+                start = step - output[0] + 1
+                if best is None or start < best[0]:
+                    best = (start, output[1])
+        return best[1] if best is not None else None
+
 
+FORWARD = Automaton(DIGITS)
+# Scanning from the end sees every word backwards
+BACKWARD = Automaton({word[::-1]: value for word, value in DIGITS.items()})
+
+
+def solve(input_lines: Iterable[str]):
+    total = 0
     for line in input_lines:
-        while not (digit := next((digit for digit in digits if line.startswith(digit)), None)):
-            line = line[1:]
-        first = digits[digit]
-        while not (digit := next((digit for digit in digits if line.endswith(digit)), None)):
-            line = line[:-1]
-        last = digits[digit]
-        total += int(first + last)
+        first = FORWARD.first_match(line, range(len(line)))
+        last = BACKWARD.first_match(line, range(len(line) - 1, -1, -1))
+        assert first is not None and last is not None
+        total += first * 10 + last
     return total
 
 
-def main():
-    with open("01/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
+def solve_chunk(path: str, start: int, end: int):
+    return solve(line.decode() for line in iter_lines(map_file(path), start, end))
 
-    print(solve(test_input))
+
+def solve_file(path: str, jobs: Optional[int] = None):
+    return sum(map_chunks(__file__, "solve_chunk", path, jobs))
+
+
+def main():
+    print(solve(text_lines("01/input.txt")))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+from main import solve, solve_file
+from utils.generators import DIGIT_WORDS, generate
+
+
+def test_main():
+    assert (
+        solve(
+            [
+                "two1nine",
+                "eightwothree",
+                "abcone2threexyz",
+                "xtwone3four",
+                "4nineeightseven2",
+                "zoneight234",
+                "7pqrstsixteen",
+            ]
+        )
+        == 281
+    )
+
+
+def test_overlapping_words():
+    assert solve(["eightwo", "oneight", "twone"]) == 82 + 18 + 21
+
+
+def test_long_line():
+    assert solve(["x" * 10000 + "seven" + "y" * 10000 + "3nine" + "z" * 10000]) == 79
+
+
+def test_long_input():
+    # Each line is letters around a digit word followed by a digit
+    lines = generate(1, 2, shape="long")
+    assert {len(line) for line in lines} == {20000}
+    expected = 0
+    for line in lines:
+        word = next(word for word in DIGIT_WORDS if word in line)
+        expected += (DIGIT_WORDS.index(word) + 1) * 10 + int(line[line.index(word) + len(word)])
+    assert solve(lines) == expected
+
+
+def test_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("eightwo\ntwone\n" * 50)
+    assert solve_file(str(path), jobs=2) == (82 + 21) * 50
@@ -1,45 +1,73 @@
-import re
+from math import prod
+from typing import Iterable
 
+from utils.loader import text_lines
 
-class Game:
-    game_re = re.compile(r"^Game (?P<id>\d+): (?P<grabs>((((\d+)\s(\w+),?\s?)+);?\s?)+)$")
-    grap_re = re.compile(r"((?:\d+\s\w+,?\s?)+);?")
-    cubes_re = re.compile(r"(?P<count>\d+)\s(?P<colour>\w+),?")
+# Colour ids index the per-game maxima. Other colours get the next free id when first seen in a solve
+COLOURS = ("red", "green", "blue")
+LIMITS = {"red": 12, "green": 13, "blue": 14}
 
-    def __init__(self, line: str):
-        assert (m := self.game_re.match(line))
-        self.id = int(m.group("id"))
-        grabs_part = m.group("grabs")
-        grabs = self.grap_re.findall(grabs_part)
-        self.grabs: list[dict[str, int]] = [
-            (cubes := self.cubes_re.findall(g)) and {c[1]: int(c[0]) for c in cubes} for g in grabs
-        ]
 
-    def max_by_colour(self):
-        colours = set(c for g in self.grabs for c in g)
-        return {colour: max(g.get(colour, 0) for g in self.grabs) for colour in colours}
+def read_game(line: str, colour_ids: dict[str, int], maxima: list[int]) -> int:
+    # Tokenises "Game <id>: <count> <colour>, <count> <colour>; ..." from left to right and returns the game id.
+    # maxima gets the highest count per colour id, -1 for colours the game never shows, and colour_ids an id for
+    # every colour not seen before. Grabs don't matter for the maxima, so "," and ";" are treated alike
+    colon = line.find(":")
+    header = line[:colon].split() if colon >= 0 else []
+    if len(header) != 2 or header[0] != "Game" or not header[1].isdigit():
+        raise ValueError(f"Malformed game record: {line!r}")
+    maxima[:] = [-1] * len(colour_ids)
 
+    # Each pair runs up to the next "," or ";". A separator is only searched for again once the scan has passed the
+    # last one found, so the line is read once
+    position = colon + 1
+    comma = semicolon = colon
+    while True:
+        if 0 <= comma < position:
+            comma = line.find(",", position)
+        if 0 <= semicolon < position:
+            semicolon = line.find(";", position)
+        if comma < 0 or 0 <= semicolon < comma:
+            end = semicolon if semicolon >= 0 else len(line)
+        else:
+            end = comma
+        pair = line[position:end].split()
+        if len(pair) != 2 or not pair[0].isdigit() or not pair[1].isalpha():
+            raise ValueError(f"Malformed game record: {line!r}")
 
-def solve(input_lines: list[str]):
-    limits = {"red": 12, "green": 13, "blue": 14}
+        count, colour = int(pair[0]), pair[1]
+        if (i := colour_ids.get(colour)) is None:
+            i = colour_ids[colour] = len(colour_ids)
+            maxima.append(-1)
+        if count > maxima[i]:
+            maxima[i] = count
 
-    def get_id_if_valid(line: str):
-        game = Game(line)
-        maxes = game.max_by_colour()
-        if any(k not in limits for k in maxes):
-            return 0
-        if any(limits[k] < v for k, v in maxes.items()):
-            return 0
-        return game.id
+        if end == len(line):
+            return int(header[1])
+        position = end + 1
 
-    return sum(map(get_id_if_valid, input_lines))
 
+def solve_both(input_lines: Iterable[str]) -> tuple[int, int]:
+    # Both parts in one pass over the games, reusing a single row of maxima
+    colour_ids = {colour: i for i, colour in enumerate(COLOURS)}
+    maxima: list[int] = []
+    valid_ids = 0
+    powers = 0
+    for line in input_lines:
+        game_id = read_game(line, colour_ids, maxima)
+        # Colours without a limit can't be shown at all
+        if all(count <= LIMITS.get(colour, -1) for colour, count in zip(colour_ids, maxima)):
+            valid_ids += game_id
+        powers += prod(count for count in maxima if count >= 0)
+    return valid_ids, powers
 
-def main():
-    with open("02/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
 
-    print(solve(test_input))
+def solve(input_lines: Iterable[str]):
+    return solve_both(input_lines)[0]
+
+
+def main():
+    print(solve(text_lines("02/input.txt")))
 
 
 if __name__ == "__main__":
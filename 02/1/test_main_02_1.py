@@ -0,0 +1,49 @@
+import pytest
+
+from main import COLOURS, read_game, solve, solve_both
+from utils.generators import generate
+
+EXAMPLE = [
+    "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green",
+    "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue",
+    "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red",
+    "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red",
+    "Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green",
+]
+
+
+def test_main():
+    assert solve(EXAMPLE) == 8
+
+
+def test_malformed():
+    with pytest.raises(ValueError):
+        solve(["Game 1: " + "1 red " * 30 + "!"])
+
+
+def test_adversarial():
+    # Games of a thousand grabs, each showing every colour at its highest count, then the malformed record
+    games = generate(2, 1, shape="adversarial")
+    assert solve_both(games[:-1]) == (0, 10 * 20**3)
+    with pytest.raises(ValueError):
+        solve(games)
+
+
+def test_solve_both():
+    assert solve_both(EXAMPLE) == (8, 2286)
+
+
+def test_colours_per_solve():
+    # Colours met in one solve don't carry over into the next
+    assert solve_both(["Game 1: 3 purple, 2 red"]) == (0, 6)
+    assert solve_both(EXAMPLE) == (8, 2286)
+
+    purple_ids = {colour: i for i, colour in enumerate(COLOURS)}
+    assert read_game("Game 1: 3 purple, 2 red", purple_ids, []) == 1
+    assert "purple" in purple_ids
+    # A fresh registry sees only the colours of the line it reads
+    colour_ids = {colour: i for i, colour in enumerate(COLOURS)}
+    maxima: list[int] = []
+    assert read_game(EXAMPLE[0], colour_ids, maxima) == 1
+    assert list(colour_ids) == ["red", "green", "blue"]
+    assert maxima == [4, 2, 6]
@@ -1,33 +1,15 @@
 import numpy as np
-from scipy.signal import convolve2d
 
-
-def get_symbol_adjacent(input_lines: list[str]):
-    symbols = np.array([[0 if c in "0123456789." else 1 for c in line] for line in input_lines])
-    kernel = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
-    return convolve2d(symbols, kernel, mode="same", boundary="fill", fillvalue=0)
+from utils.grid import Grid, NumberIndex
 
 
 def solve(input_lines: list[str]):
-    symbol_adjacent = get_symbol_adjacent(input_lines)
-    numbers = []
-    for i, line in enumerate(input_lines):
-        acc = ""
-        had_symbol = False
-        for j, c in enumerate(line):
-            if c in "0123456789":
-                if symbol_adjacent[i][j] != 0:
-                    had_symbol = True
-                acc += c
-            else:
-                if had_symbol:
-                    numbers.append(acc)
-                acc = ""
-                had_symbol = False
-        if had_symbol:
-            numbers.append(acc)
-
-    return sum(map(int, numbers))
+    grid = Grid.from_lines(input_lines)
+    index = NumberIndex(grid)
+    symbols = grid.in_bounds & ~grid.mask("0123456789.")
+    # A number is a part number when any of its cells is next to a symbol
+    touched = np.bincount(index.ids[grid.dilate(symbols)], minlength=index.values.size) > 0
+    return int(index.values[1:][touched[1:]].sum())
 
 
 def main():
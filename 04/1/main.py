@@ -1,4 +1,12 @@
+import mmap
 import re
+from functools import cache
+from typing import TYPE_CHECKING, Iterable, Union
+
+from utils.loader import grid_view, map_file
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Card:
@@ -18,16 +26,91 @@ class Card:
         return 2 ** (count - 1)
 
 
-def solve(input_lines: list[str]):
-    cards = [Card(line) for line in input_lines]
+def solve(input_lines: Iterable[str]):
+    cards = (Card(line) for line in input_lines)
     return sum(card.score for card in cards)
 
 
-def main():
-    with open("04/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
+@cache
+def bits() -> "np.ndarray":
+    # bits()[n] is the two 64 bit words with only bit n set
+    import numpy as np
+
+    table = np.zeros((100, 2), dtype=np.uint64)
+    table[np.arange(100), np.arange(100) // 64] = np.left_shift(np.uint64(1), np.arange(100, dtype=np.uint64) % 64)
+    return table
+
+
+@cache
+def popcount() -> "np.ndarray":
+    import numpy as np
+
+    return np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+
+def number_columns(row: "np.ndarray", start: int, end: int) -> "np.ndarray":
+    # Column of the last digit of every number between start and end
+    import numpy as np
+
+    digit = (row[start:end] >= ord("0")) & (row[start:end] <= ord("9"))
+    return start + np.flatnonzero(digit & ~np.append(digit[1:], False))
+
+
+def read_numbers(cards: "np.ndarray", last: "np.ndarray") -> "np.ndarray":
+    # Every card has its numbers in the same columns, numbers are below 100. Bytes below "0" wrap around past 9
+    import numpy as np
+
+    ones = cards[:, last] - ord("0")
+    tens = cards[:, last - 1] - ord("0")
+    if (ones > 9).any():
+        raise ValueError("Cards are not aligned to the same columns")
+    if (cards[:, last - 2] - ord("0") <= 9).any():
+        raise ValueError("Card numbers must be below 100")
+    return ones + np.where(tens <= 9, tens * 10, 0).astype(np.uint8)
 
-    print(solve(test_input))
+
+def bitmasks(numbers: "np.ndarray") -> "np.ndarray":
+    # Two 64 bit words per card with bit n set for every number n on it, built one column of numbers at a time
+    import numpy as np
+
+    table = bits()
+    masks = np.zeros((len(numbers), 2), dtype=np.uint64)
+    for column in numbers.T:
+        masks |= table[column]
+    return masks
+
+
+def match_counts(data: Union[mmap.mmap, bytes]) -> "np.ndarray":
+    import numpy as np
+
+    cards = grid_view(data)
+    if not cards.size:
+        return np.zeros(0, dtype=np.int64)
+    colon = bytes(cards[0]).index(b":")
+    bar = bytes(cards[0]).index(b"|")
+    if (cards[:, colon] != ord(":")).any() or (cards[:, bar] != ord("|")).any():
+        raise ValueError("Cards are not aligned to the same columns")
+
+    winning = bitmasks(read_numbers(cards, number_columns(cards[0], colon + 1, bar)))
+    pick_columns = number_columns(cards[0], bar + 1, cards.shape[1])
+    picks = bitmasks(read_numbers(cards, pick_columns))
+    # A bitmask holds every pick once, where solve counts a repeated pick each time it matches
+    if (popcount()[picks.view(np.uint8)].sum(axis=1) != len(pick_columns)).any():
+        raise ValueError("Cards with repeated picks need the line by line solve")
+    # Popcount of the common bits, one byte at a time
+    return popcount()[(winning & picks).view(np.uint8)].sum(axis=1)
+
+
+def solve_buffer(data: Union[mmap.mmap, bytes]):
+    # Batch mode for inputs where every card has the same layout, as in the puzzle input
+    import numpy as np
+
+    counts = match_counts(data)
+    return int(np.left_shift(1, counts[counts > 0] - 1).sum())
+
+
+def main():
+    print(solve_buffer(map_file("04/input.txt")))
 
 
 if __name__ == "__main__":
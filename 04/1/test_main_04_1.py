@@ -0,0 +1,29 @@
+import pytest
+
+from main import solve, solve_buffer
+
+EXAMPLE = [
+    "Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53",
+    "Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19",
+    "Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1",
+    "Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83",
+    "Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36",
+    "Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11",
+]
+
+
+def test_main():
+    assert solve(EXAMPLE) == 13
+
+
+def test_buffer():
+    assert solve_buffer("\n".join(EXAMPLE).encode()) == 13
+    assert solve_buffer("".join(line + "\r\n" for line in EXAMPLE).encode()) == 13
+    assert solve_buffer(b"") == 0
+
+
+def test_buffer_rejects():
+    with pytest.raises(ValueError):
+        solve_buffer(b"Card 1: 123  5 | 23  7\n")
+    with pytest.raises(ValueError):
+        solve_buffer(b"Card 1:  5  5 |  5  5\n")
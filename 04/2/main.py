@@ -1,4 +1,8 @@
 import re
+from collections import deque
+from typing import Iterable
+
+from utils.loader import text_lines
 
 
 class Card:
@@ -11,41 +15,53 @@ class Card:
         self._nums = [int(n) for n in m.group("nums").split() if n]
 
     @property
-    def score(self):
-        count = sum(1 for n in self._nums if n in self._winning)
-        if count == 0:
-            return []
-        return range(self._id + 1, self._id + count + 1)
+    def matches(self):
+        return sum(1 for n in self._nums if n in self._winning)
 
     @property
     def id(self):
         return self._id
 
 
-def solve(input_lines: list[str]):
-    cards = {(c := Card(line)).id: c for line in input_lines}
-    score_cache: dict[int, int] = {card_id: None for card_id in cards}
+def copy_counts(matches: list[int]) -> list[int]:
+    # Card i with m matches adds its copies to cards i + 1 to i + m. Those ranges go into a difference array, the
+    # running sum of which is the number of copies won by earlier cards
+    changes = [0] * (len(matches) + 1)
+    copies = []
+    won = 0
+    for i, count in enumerate(matches):
+        won += changes[i]
+        copies.append(1 + won)
+        if count:
+            # Copies of cards past the end of the table don't exist
+            changes[i + 1] += copies[i]
+            changes[min(i + count + 1, len(matches))] -= copies[i]
+    return copies
 
-    win_count = 0
 
-    def _get_win_count(card_id: int):
-        if card_id not in score_cache:
-            return 0
-        if score_cache[card_id] is None:
-            next_cards = cards[card_id].score
-            score_cache[card_id] = 1 + sum(_get_win_count(next_card) for next_card in next_cards)
-        return score_cache[card_id]
+def solve(input_lines: Iterable[str]):
+    return sum(copy_counts([Card(line).matches for line in input_lines]))
 
-    for card_id in cards:
-        win_count += _get_win_count(card_id)
-    return win_count
 
+def solve_stream(input_lines: Iterable[str]):
+    # The same difference array, but only the part ahead of the current card. It never grows past the highest match
+    # count plus one, however many cards there are
+    changes: deque[int] = deque()
+    total = 0
+    won = 0
+    for line in input_lines:
+        won += changes.popleft() if changes else 0
+        copies = 1 + won
+        total += copies
+        if count := Card(line).matches:
+            changes.extend([0] * (count + 1 - len(changes)))
+            changes[0] += copies
+            changes[count] -= copies
+    return total
 
-def main():
-    with open("04/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
 
-    print(solve(test_input))
+def main():
+    print(solve(text_lines("04/input.txt")))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+from main import solve, solve_stream
+
+EXAMPLE = [
+    "Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53",
+    "Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19",
+    "Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1",
+    "Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83",
+    "Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36",
+    "Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11",
+]
+
+
+def test_main():
+    assert solve(EXAMPLE) == 30
+    assert solve_stream(iter(EXAMPLE)) == 30
+
+
+def test_long_cascade():
+    # Every card wins one copy of the next, card n ends up with n copies
+    cards = [f"Card {i}: 1 | 1 2" for i in range(1, 5001)]
+    assert solve(cards) == 5000 * 5001 // 2
+    assert solve_stream(iter(cards)) == 5000 * 5001 // 2
@@ -1,5 +1,46 @@
 from functools import reduce
 
+import numpy as np
+
+# Upper end of the last piece of every map, far above any value in the puzzle but with room for the offsets
+UNBOUNDED = 2**62
+
+
+class PiecewiseLinear:
+    # f(x) = x + offsets[i] for starts[i] <= x < starts[i + 1], on the whole domain x >= 0
+    def __init__(self, starts: np.ndarray, offsets: np.ndarray):
+        self.starts = starts
+        self.offsets = offsets
+
+    @classmethod
+    def identity(cls) -> "PiecewiseLinear":
+        return cls(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))
+
+    @property
+    def ends(self) -> np.ndarray:
+        return np.append(self.starts[1:], UNBOUNDED)
+
+    def __call__(self, values: np.ndarray) -> np.ndarray:
+        return values + self.offsets[np.searchsorted(self.starts, values, side="right") - 1]
+
+    def then(self, other: "PiecewiseLinear") -> "PiecewiseLinear":
+        # Each piece of self is cut where its image crosses a breakpoint of other, the parts add up both offsets
+        low = self.starts + self.offsets
+        high = self.ends + self.offsets
+        first = np.searchsorted(other.starts, low, side="right") - 1
+        counts = np.searchsorted(other.starts, high, side="left") - first
+        piece = np.repeat(np.arange(self.starts.size), counts)
+        # Position of every part within its piece, 0, 1, ... counts - 1
+        part = np.arange(piece.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        cut = first[piece] + part
+        starts = np.maximum(self.starts[piece], other.starts[cut] - self.offsets[piece])
+        return PiecewiseLinear(starts, self.offsets[piece] + other.offsets[cut]).simplified()
+
+    def simplified(self) -> "PiecewiseLinear":
+        # Neighbouring pieces with the same offset are one piece
+        keep = np.append(True, self.offsets[1:] != self.offsets[:-1])
+        return PiecewiseLinear(self.starts[keep], self.offsets[keep])
+
 
 class Section:
     def __init__(self, lines: list[str]):
@@ -12,10 +53,24 @@ class Section:
                 return value - source + dest
         return value
 
+    def function(self) -> PiecewiseLinear:
+        # Values outside every range keep their offset of 0
+        starts = [0]
+        offsets = [0]
+        for dest, source, length in self._ranges:
+            if source > starts[-1]:
+                starts.append(source)
+                offsets.append(dest - source)
+            elif source == starts[-1]:
+                offsets[-1] = dest - source
+            else:
+                raise ValueError(f"Overlapping ranges in {self._source}-to-{self._destination} map")
+            starts.append(source + length)
+            offsets.append(0)
+        return PiecewiseLinear(np.array(starts, dtype=np.int64), np.array(offsets, dtype=np.int64)).simplified()
 
-def solve(input_lines: list[str]):
-    seeds = list(map(int, input_lines[0].split(": ")[1].split()))
 
+def read_sections(input_lines: list[str]) -> list[Section]:
     def reduce_sections(acc: list[list[str]], line: str):
         if line == "":
             acc.append([])
@@ -23,12 +78,15 @@ def solve(input_lines: list[str]):
             acc[-1].append(line)
         return acc
 
-    sections = list(map(Section, reduce(reduce_sections, input_lines[2:], [[]])))
+    return list(map(Section, reduce(reduce_sections, input_lines[2:], [[]])))
 
-    def map_seed(_seed: int):
-        return reduce(lambda seed, s: s.map_to_destination(seed), sections, _seed)
 
-    return min(map(map_seed, seeds))
+def solve(input_lines: list[str]):
+    seeds = np.array(input_lines[0].split(": ")[1].split(), dtype=np.int64)
+    # All seven maps composed into one, then a single lookup for all seeds
+    sections = read_sections(input_lines)
+    location = reduce(lambda f, section: f.then(section.function()), sections, PiecewiseLinear.identity())
+    return int(location(seeds).min())
 
 
 def main():
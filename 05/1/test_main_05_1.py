@@ -0,0 +1,54 @@
+import random
+from functools import reduce
+
+import numpy as np
+from main import read_sections, solve
+
+EXAMPLE = [
+    "seeds: 79 14 55 13",
+    "",
+    "seed-to-soil map:",
+    "50 98 2",
+    "52 50 48",
+    "",
+    "soil-to-fertilizer map:",
+    "0 15 37",
+    "37 52 2",
+    "39 0 15",
+    "",
+    "fertilizer-to-water map:",
+    "49 53 8",
+    "0 11 42",
+    "42 0 7",
+    "57 7 4",
+    "",
+    "water-to-light map:",
+    "88 18 7",
+    "18 25 70",
+    "",
+    "light-to-temperature map:",
+    "45 77 23",
+    "81 45 19",
+    "68 64 13",
+    "",
+    "temperature-to-humidity map:",
+    "0 69 1",
+    "1 0 69",
+    "",
+    "humidity-to-location map:",
+    "60 56 37",
+    "56 93 4",
+]
+
+
+def test_example():
+    assert solve(EXAMPLE) == 35
+
+
+def test_composed_map():
+    sections = read_sections(EXAMPLE)
+    composed = reduce(lambda f, section: f.then(section.function()), sections[1:], sections[0].function())
+    rng = random.Random(5)
+    seeds = list(range(120)) + [rng.randrange(10**6) for _ in range(100)]
+    expected = [reduce(lambda value, section: section.map_to_destination(value), sections, seed) for seed in seeds]
+    assert composed(np.array(seeds)).tolist() == expected
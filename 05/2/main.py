@@ -1,5 +1,7 @@
+from bisect import bisect_right
 from dataclasses import dataclass
 from functools import reduce
+from typing import Iterable, Iterator, Optional
 
 
 @dataclass
@@ -14,44 +16,126 @@ class Range:
         return Range(start, self.end)
 
 
+class IntervalSet:
+    # Sorted ranges with no overlaps and no gapless neighbours, so every set of values has exactly one form
+    def __init__(self, ranges: Iterable[Range] = ()):
+        self.ranges: list[Range] = []
+        for r in sorted((r for r in ranges if r.start < r.end), key=lambda r: r.start):
+            if self.ranges and r.start <= self.ranges[-1].end:
+                self.ranges[-1] = Range(self.ranges[-1].start, max(self.ranges[-1].end, r.end))
+            else:
+                self.ranges.append(r)
+
+    def __iter__(self) -> Iterator[Range]:
+        return iter(self.ranges)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalSet) and self.ranges == other.ranges
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.ranges})"
+
+    @property
+    def size(self) -> int:
+        return sum(r.end - r.start for r in self.ranges)
+
+
 class Section:
     def __init__(self, lines: list[str]):
         self._source, _, self._destination = lines[0].split()[0].split("-")
         self._ranges = sorted([tuple(map(int, line.split())) for line in lines[1:]], key=lambda r: r[1])
+        # Rules don't overlap, so their ends are sorted too
+        self._ends = [source + length for _, source, length in self._ranges]
+        # Neither do their destinations
+        self._by_destination = sorted(self._ranges)
+        self._destinations = [dest for dest, _, _ in self._by_destination]
+
+    @property
+    def name(self) -> str:
+        return f"{self._source}-to-{self._destination}"
 
     def map_to_destination(self, value: Range) -> list[Range]:
         mapped_ranges = []
-        ranges = list(self._ranges)
-
-        while any(ranges):
-            dest, source, length = ranges[0]
+        # Rules ending before the range starts can't apply
+        for i in range(bisect_right(self._ends, value.start), len(self._ranges)):
+            dest, source, length = self._ranges[i]
             if source >= value.end:
                 mapped_ranges.append(value)
-                break
+                return mapped_ranges
             if source > value.start:
                 mapped_ranges.append(Range(value.start, source))
                 value = value.trim(source)
-                continue
             if source + length <= value.start:
-                ranges.pop(0)
                 continue
             if source + length >= value.end:
                 mapped_ranges.append(value.offset(dest - source))
-                break
+                return mapped_ranges
 
             mapped_ranges.append(Range(value.start, source + length).offset(dest - source))
             value = value.trim(source + length)
-            ranges.pop(0)
-        if not any(ranges):
-            mapped_ranges.append(value)
+        mapped_ranges.append(value)
 
         return mapped_ranges
 
-
-def solve(input_lines: list[str]):
+    def _rule(self, value: int) -> Optional[int]:
+        # Index of the rule covering value, if any
+        i = bisect_right(self._ends, value)
+        return i if i < len(self._ranges) and self._ranges[i][1] <= value else None
+
+    def map_value(self, value: int) -> int:
+        if (i := self._rule(value)) is None:
+            return value
+        dest, source, _ = self._ranges[i]
+        return value + dest - source
+
+    def breakpoints(self) -> set[int]:
+        # Values where the mapping switches to another offset
+        return {source for _, source, _ in self._ranges} | set(self._ends)
+
+    def preimages(self, value: int) -> list[int]:
+        # Every x with map_value(x) == value: at most one through a rule, and value itself if no rule covers it
+        found = []
+        i = bisect_right(self._destinations, value) - 1
+        if i >= 0 and value < self._destinations[i] + self._by_destination[i][2]:
+            dest, source, _ = self._by_destination[i]
+            found.append(value - dest + source)
+        if self._rule(value) is None:
+            found.append(value)
+        return found
+
+    def map_set(self, values: IntervalSet) -> IntervalSet:
+        # One sweep over the sorted ranges and the sorted rules together, neither is ever revisited
+        mapped_ranges = []
+        i = 0
+        for value in values:
+            start, end = value.start, value.end
+            while i < len(self._ranges) and self._ends[i] <= start:
+                i += 1
+            while start < end:
+                if i == len(self._ranges) or self._ranges[i][1] >= end:
+                    mapped_ranges.append(Range(start, end))
+                    break
+                dest, source, length = self._ranges[i]
+                if source > start:
+                    mapped_ranges.append(Range(start, source))
+                    start = source
+                stop = min(end, source + length)
+                mapped_ranges.append(Range(start + dest - source, stop + dest - source))
+                start = stop
+                if stop == source + length:
+                    i += 1
+        return IntervalSet(mapped_ranges)
+
+
+def read_seed_ranges(input_lines: list[str]) -> list[Range]:
     seeds = list(map(int, input_lines[0].split(": ")[1].split()))
-    seed_ranges = [Range(start, start + length) for start, length in zip(seeds[::2], seeds[1::2])]
+    return [Range(start, start + length) for start, length in zip(seeds[::2], seeds[1::2])]
 
+
+def read_sections(input_lines: list[str]) -> list[Section]:
     def reduce_sections(acc: list[list[str]], line: str):
         if line == "":
             acc.append([])
@@ -59,14 +143,57 @@ def solve(input_lines: list[str]):
             acc[-1].append(line)
         return acc
 
-    sections = list(map(Section, reduce(reduce_sections, input_lines[2:], [[]])))
+    return list(map(Section, reduce(reduce_sections, input_lines[2:], [[]])))
+
 
-    def map_seed(_seed_range: Range):
-        return reduce(
-            lambda seeds, s: [dest for seed in seeds for dest in s.map_to_destination(seed)], sections, [_seed_range]
-        )
+def map_seed(sections: list[Section], seed_range: Range) -> list[Range]:
+    # Range by range, the fragments of one seed range are never merged
+    return reduce(
+        lambda seeds, s: [dest for seed in seeds for dest in s.map_to_destination(seed)], sections, [seed_range]
+    )
 
-    return min([seed.start for seeds in map(map_seed, seed_ranges) for seed in seeds])
+
+def solve(input_lines: list[str]):
+    locations = reduce(
+        lambda values, section: section.map_set(values),
+        read_sections(input_lines),
+        IntervalSet(read_seed_ranges(input_lines)),
+    )
+    return locations.ranges[0].start
+
+
+def solve_reverse(input_lines: list[str]):
+    # Location is piecewise x + c over seed space. The minimum over a seed range is at the range's start or where a
+    # new piece begins, and pieces begin exactly where some section's breakpoint pulls back to. Walking the sections
+    # backwards collects those points without ever looking at the width of the seed ranges
+    sections = read_sections(input_lines)
+    seeds = IntervalSet(read_seed_ranges(input_lines))
+    starts = [r.start for r in seeds]
+    ends = [r.end for r in seeds]
+
+    points: set[int] = set()
+    for section in reversed(sections):
+        points = {x for y in points for x in section.preimages(y)} | section.breakpoints()
+    points.update(starts)
+
+    def in_seeds(x: int):
+        i = bisect_right(starts, x) - 1
+        return i >= 0 and x < ends[i]
+
+    return min(reduce(lambda value, s: s.map_value(value), sections, x) for x in points if in_seeds(x))
+
+
+def stats(input_lines: list[str]) -> dict[str, str]:
+    # Fragments after each section, coalesced interval sets against the unmerged per seed range lists
+    seed_ranges = read_seed_ranges(input_lines)
+    values = IntervalSet(seed_ranges)
+    fragments = [[r] for r in seed_ranges]
+    counts = {"seed": f"{len(values)} ranges ({len(fragments)} unmerged)"}
+    for section in read_sections(input_lines):
+        values = section.map_set(values)
+        fragments = [[dest for r in ranges for dest in section.map_to_destination(r)] for ranges in fragments]
+        counts[section.name] = f"{len(values)} ranges ({sum(map(len, fragments))} unmerged)"
+    return counts
 
 
 def main():
@@ -1,3 +1,5 @@
+import random
+
 from main import *
 
 
@@ -48,40 +50,91 @@ def test_section_3():
     ]
 
 
+EXAMPLE = [
+    "seeds: 79 14 55 13",
+    "",
+    "seed-to-soil map:",
+    "50 98 2",
+    "52 50 48",
+    "",
+    "soil-to-fertilizer map:",
+    "0 15 37",
+    "37 52 2",
+    "39 0 15",
+    "",
+    "fertilizer-to-water map:",
+    "49 53 8",
+    "0 11 42",
+    "42 0 7",
+    "57 7 4",
+    "",
+    "water-to-light map:",
+    "88 18 7",
+    "18 25 70",
+    "",
+    "light-to-temperature map:",
+    "45 77 23",
+    "81 45 19",
+    "68 64 13",
+    "",
+    "temperature-to-humidity map:",
+    "0 69 1",
+    "1 0 69",
+    "",
+    "humidity-to-location map:",
+    "60 56 37",
+    "56 93 4",
+]
+
+
 def test_example():
-    input_lines = [
-        "seeds: 79 14 55 13",
-        "",
-        "seed-to-soil map:",
-        "50 98 2",
-        "52 50 48",
-        "",
-        "soil-to-fertilizer map:",
-        "0 15 37",
-        "37 52 2",
-        "39 0 15",
-        "",
-        "fertilizer-to-water map:",
-        "49 53 8",
-        "0 11 42",
-        "42 0 7",
-        "57 7 4",
-        "",
-        "water-to-light map:",
-        "88 18 7",
-        "18 25 70",
-        "",
-        "light-to-temperature map:",
-        "45 77 23",
-        "81 45 19",
-        "68 64 13",
-        "",
-        "temperature-to-humidity map:",
-        "0 69 1",
-        "1 0 69",
-        "",
-        "humidity-to-location map:",
-        "60 56 37",
-        "56 93 4",
-    ]
-    assert solve(input_lines) == 46
+    assert solve(EXAMPLE) == 46
+    assert solve_reverse(EXAMPLE) == 46
+
+
+def test_interval_set():
+    assert IntervalSet([Range(5, 8), Range(0, 2), Range(2, 3), Range(6, 10), Range(4, 4)]) == IntervalSet(
+        [Range(0, 3), Range(5, 10)]
+    )
+
+
+def test_map_set():
+    section = Section(
+        [
+            "seed-to-soil map:",
+            "50 98 2",
+            "52 50 48",
+        ]
+    )
+    values = IntervalSet([Range(10, 20), Range(48, 60), Range(97, 110)])
+    expected = IntervalSet(r for value in values for r in section.map_to_destination(value))
+    assert section.map_set(values) == expected
+    assert expected == IntervalSet([Range(10, 20), Range(48, 62), Range(99, 110)])
+
+
+def forward_minimum(input_lines: list[str]):
+    sections = read_sections(input_lines)
+    return min(r.start for seed_range in read_seed_ranges(input_lines) for r in map_seed(sections, seed_range))
+
+
+def random_input(rng: random.Random) -> list[str]:
+    seeds = []
+    for _ in range(rng.randint(1, 4)):
+        seeds.extend([rng.randrange(200), rng.randint(1, 50)])
+    lines = ["seeds: " + " ".join(map(str, seeds))]
+    for i in range(rng.randint(1, 7)):
+        # Disjoint sources and disjoint destinations, but not necessarily a bijection
+        cuts = sorted(rng.sample(range(1, 250), k=6))
+        sources = list(zip(cuts[::2], cuts[1::2]))
+        destinations = rng.sample(range(0, 1000, 250), k=len(sources))
+        rules = [f"{dest} {start} {end - start}" for dest, (start, end) in zip(destinations, sources)]
+        lines.extend(["", f"a{i}-to-a{i + 1} map:", *rules])
+    return lines
+
+
+def test_reverse_matches_forward():
+    rng = random.Random(5)
+    for _ in range(200):
+        input_lines = random_input(rng)
+        assert solve_reverse(input_lines) == forward_minimum(input_lines)
+        assert solve(input_lines) == forward_minimum(input_lines)
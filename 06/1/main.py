@@ -1,35 +1,64 @@
-from math import ceil, floor
+from math import isqrt
+from typing import Iterable
 
-e = 10**-10
+import numpy as np
 
+from utils.loader import text_lines
 
-def solve_quadratic(a: float, b: float, c: float):
-    discriminant = b**2 - 4 * a * c
+# From these on, time**2 or 4 * dist no longer fits in an int64 and races are solved with Python ints
+MAX_BATCH_TIME = 2**31
+MAX_BATCH_DIST = 2**61
+
+
+def wins(time: int, dist: int) -> int:
+    # Holding the button for h wins when h * (time - h) > dist, so the shortest winning hold is just above the lower
+    # root (time - sqrt(time**2 - 4 * dist)) / 2. isqrt is exact for integers of any size and rounds down, which
+    # leaves hold at most one short of it
+    discriminant = time * time - 4 * dist
     if discriminant < 0:
-        raise ValueError("No real solutions")
+        return 0
+    hold = (time - isqrt(discriminant)) // 2
+    if hold * (time - hold) <= dist:
+        hold += 1
+    # The winning holds are symmetric around time / 2, past it there are none
+    return max(0, time - 2 * hold + 1)
 
-    x1 = (-b + discriminant**0.5) / (2 * a)
-    x2 = (-b - discriminant**0.5) / (2 * a)
-    return x1, x2
 
+def wins_batch(times: np.ndarray, dists: np.ndarray) -> np.ndarray:
+    # wins for many races at once, for times below MAX_BATCH_TIME and records below MAX_BATCH_DIST. The float square
+    # root can be one off either way, which the two corrections undo, and races that can't be won end up with a count
+    # of 0 like in wins
+    times = times.astype(np.int64)
+    dists = dists.astype(np.int64)
+    discriminant = np.maximum(times * times - 4 * dists, 0)
+    root = np.sqrt(discriminant.astype(np.float64)).astype(np.int64)
+    root -= root * root > discriminant
+    root += (root + 1) * (root + 1) <= discriminant
 
-def solve(input_lines: list[str]):
-    times = [int(v) for v in input_lines[0].split()[1:] if v]
-    dists = [int(v) for v in input_lines[1].split()[1:] if v]
+    hold = (times - root) // 2
+    hold += hold * (times - hold) <= dists
+    return np.maximum(0, times - 2 * hold + 1)
 
-    range_product = 1
 
-    for time, dist in zip(times, dists):
-        roots = solve_quadratic(-1, time, -dist)
-        range_product *= floor(roots[1] - e) - ceil(roots[0] + e) + 1
-    return range_product
+def product(values: list[int]) -> int:
+    # Multiplying in pairs keeps the operands balanced, one at a time would make every step as slow as the last
+    while len(values) > 1:
+        values = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)] + values[len(values) & ~1 :]
+    return values[0] if values else 1
 
 
-def main():
-    with open("06/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
+def solve(input_lines: Iterable[str]):
+    lines = iter(input_lines)
+    times = [int(v) for v in next(lines).split()[1:] if v]
+    dists = [int(v) for v in next(lines).split()[1:] if v]
 
-    print(solve(test_input))
+    if max(map(abs, times), default=0) < MAX_BATCH_TIME and max(map(abs, dists), default=0) < MAX_BATCH_DIST:
+        return product(wins_batch(np.array(times, dtype=np.int64), np.array(dists, dtype=np.int64)).tolist())
+    return product([wins(time, dist) for time, dist in zip(times, dists)])
+
+
+def main():
+    print(solve(text_lines("06/input.txt")))
 
 
 if __name__ == "__main__":
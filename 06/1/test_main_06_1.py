@@ -1,4 +1,7 @@
-from main import solve
+import random
+
+import numpy as np
+from main import solve, wins, wins_batch
 
 
 def test_main():
@@ -11,3 +14,21 @@ def test_main():
         )
         == 288
     )
+
+
+def test_wins():
+    rng = random.Random(6)
+    races = [(t, d) for t in range(40) for d in range(t * t // 4 + 2)]
+    races += [(t, rng.randrange(t * t // 4 + 2)) for t in (rng.randrange(2**31) for _ in range(1000))]
+    times, dists = map(np.array, zip(*races))
+    expected = [sum(1 for h in range(t + 1) if h * (t - h) > d) for t, d in races if t < 40]
+    assert [wins(t, d) for t, d in races if t < 40] == expected
+    assert wins_batch(times, dists).tolist() == [wins(t, d) for t, d in races]
+
+
+def test_huge_records():
+    # Records like these overflow int64 arithmetic and must not go through wins_batch
+    assert solve(["Time: 10 7", "Distance: 4611686018427387904 9"]) == 0
+    assert solve(["Time: 10 7", f"Distance: {2**70} 9"]) == 0
+    assert solve(["Time: 10 7", f"Distance: {2**61 - 1} 9"]) == 0
+    assert solve(["Time: 10 7", "Distance: 20 9"]) == wins(10, 20) * wins(7, 9)
@@ -1,31 +1,32 @@
-from math import ceil, floor
+from math import isqrt
+from typing import Iterable
 
-e = 10**-10
+from utils.loader import text_lines
 
 
-def solve_quadratic(a: float, b: float, c: float):
-    discriminant = b**2 - 4 * a * c
+def wins(time: int, dist: int) -> int:
+    # Holding the button for h wins when h * (time - h) > dist, so the shortest winning hold is just above the lower
+    # root (time - sqrt(time**2 - 4 * dist)) / 2. isqrt is exact for integers of any size and rounds down, which
+    # leaves hold at most one short of it
+    discriminant = time * time - 4 * dist
     if discriminant < 0:
-        raise ValueError("No real solutions")
+        return 0
+    hold = (time - isqrt(discriminant)) // 2
+    if hold * (time - hold) <= dist:
+        hold += 1
+    # The winning holds are symmetric around time / 2, past it there are none
+    return max(0, time - 2 * hold + 1)
 
-    x1 = (-b + discriminant**0.5) / (2 * a)
-    x2 = (-b - discriminant**0.5) / (2 * a)
-    return x1, x2
 
-
-def solve(input_lines: list[str]):
-    time = int(input_lines[0].split(":")[1].replace(" ", ""))
-    dist = int(input_lines[1].split(":")[1].replace(" ", ""))
-
-    roots = solve_quadratic(-1, time, -dist)
-    return floor(roots[1] - e) - ceil(roots[0] + e) + 1
+def solve(input_lines: Iterable[str]):
+    lines = iter(input_lines)
+    time = int(next(lines).split(":")[1].replace(" ", ""))
+    dist = int(next(lines).split(":")[1].replace(" ", ""))
+    return wins(time, dist)
 
 
 def main():
-    with open("06/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
-
-    print(solve(test_input))
+    print(solve(text_lines("06/input.txt")))
 
 
 if __name__ == "__main__":
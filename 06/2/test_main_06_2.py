@@ -0,0 +1,15 @@
+from main import solve, wins
+
+
+def test_main():
+    assert solve(["Time:      7  15   30", "Distance:  9  40  200"]) == 71503
+
+
+def test_huge_race():
+    time = 10**1000 + 7
+    dist = time * time // 4 - 10**600
+    count = wins(time, dist)
+    # The shortest winning hold wins and the one before it doesn't
+    hold = (time - count + 1) // 2
+    assert hold * (time - hold) > dist
+    assert (hold - 1) * (time - hold + 1) <= dist
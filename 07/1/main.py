@@ -1,48 +1,103 @@
-from functools import reduce
+import mmap
+from functools import cache
+from typing import Iterable, Union
+
+from utils.loader import map_file
+
+CARDS = "23456789TJQKA"
+CARD_VALUES = {c: i for i, c in enumerate(CARDS)}
+HAND_SIZE = 5
+
+# Summing, over the cards of a hand, how often each one occurs in it gives a different total for every hand type:
+# 25 for five of a kind, 17 for four of a kind, 13 for a full house and so on down to 5 for high card
+HAND_TYPES = {25: 6, 17: 5, 13: 4, 11: 3, 9: 2, 7: 1, 5: 0}
 
 
 def calculate_rank(cards: str):
-    count_by_type = sorted(
-        reduce(lambda acc, c: {**acc, c: acc.get(c, 0) + 1}, cards, {}).items(), key=lambda kv: kv[1], reverse=True
-    )
-    return (
-        6 if count_by_type[0][1] == 5 else
-        5 if count_by_type[0][1] == 4 else
-        4 if count_by_type[0][1] == 3 and count_by_type[1][1] == 2 else
-        3 if count_by_type[0][1] == 3 else
-        2 if count_by_type[0][1] == 2 and count_by_type[1][1] == 2 else
-        1 if count_by_type[0][1] == 2 else
-        0
-    )
+    return HAND_TYPES[sum(cards.count(c) for c in cards)]
 
 
-class Hand:
-    cards_ranked = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
+def hand_key(cards: str) -> int:
+    # The hand type in the top nibble and one nibble per card below it, 24 bits that sort like the hands do
+    key = calculate_rank(cards)
+    for c in cards:
+        key = key << 4 | CARD_VALUES[c]
+    return key
 
-    def __init__(self, cards: str) -> None:
-        self._cards = cards
-        self._ranks = [self.cards_ranked.index(c) for c in cards]
-        self._rank = calculate_rank(cards)
 
-    @property
-    def sorting_key(self):
-        return [self._rank, *self._ranks]
+def solve(input_lines: Iterable[str]):
+    keys = []
+    bids = []
+    for line in input_lines:
+        if sp := line.split():
+            keys.append(hand_key(sp[0]))
+            bids.append(int(sp[1]))
+    # Sorting indices by key keeps equal hands in input order, as sorting the hands themselves would
+    ranked = sorted(range(len(keys)), key=keys.__getitem__)
+    return sum((rank + 1) * bids[i] for rank, i in enumerate(ranked))
 
-    def __repr__(self) -> str:
-        return f"Hand({self._cards})"
 
+@cache
+def batch_tables():
+    # Byte -> card value and total -> hand type tables for the batch mode, 255 marks anything else
+    import numpy as np
 
-def solve(input_lines: list[str]):
-    hands = [(Hand(sp[0]), int(sp[1])) for line in input_lines if (sp := line.split())]
-    ranked = sorted(hands, key=lambda h: h[0].sorting_key)
-    return sum([(i + 1) * hand[1] for i, hand in enumerate(ranked)])
+    card_table = np.full(256, 255, dtype=np.uint8)
+    card_table[list(CARDS.encode())] = np.arange(len(CARDS))
+    type_table = np.full(HAND_SIZE * HAND_SIZE + 1, 255, dtype=np.uint8)
+    type_table[list(HAND_TYPES)] = list(HAND_TYPES.values())
+    return card_table, type_table
 
 
-def main():
-    with open("07/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
+def solve_buffer(data: Union[mmap.mmap, bytes]):
+    # Batch mode: every line is five cards, a space and a bid, parsed and ranked in NumPy without per line objects
+    import numpy as np
+
+    card_table, type_table = batch_tables()
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if not buffer.size:
+        return 0
+    ends = np.flatnonzero(buffer == ord("\n"))
+    if buffer[-1] != ord("\n"):
+        ends = np.append(ends, buffer.size)
+    starts = np.append(0, ends[:-1] + 1)
+    ends = ends - (buffer[np.maximum(ends - 1, 0)] == ord("\r"))
+    starts, ends = starts[ends > starts], ends[ends > starts]
+    if (ends - starts <= HAND_SIZE + 1).any() or (buffer[starts + HAND_SIZE] != ord(" ")).any():
+        raise ValueError("Every line needs five cards, a space and a bid")
 
-    print(solve(test_input))
+    cards = np.empty((HAND_SIZE, len(starts)), dtype=np.uint8)
+    for i in range(HAND_SIZE):
+        cards[i] = card_table[buffer[starts + i]]
+    if (cards == 255).any():
+        raise ValueError(f"Cards must be one of {CARDS}")
+    # The same totals as calculate_rank: every card matches itself, and each equal pair counts from both ends
+    pairs = np.zeros(len(starts), dtype=np.uint8)
+    for i in range(HAND_SIZE):
+        for j in range(i + 1, HAND_SIZE):
+            pairs += cards[i] == cards[j]
+    keys = type_table[HAND_SIZE + 2 * pairs].astype(np.int64)
+    for i in range(HAND_SIZE):
+        keys = keys << 4 | cards[i]
+
+    # Bids have different lengths, so they are read one digit position at a time, for the lines that have it
+    widths = ends - starts - HAND_SIZE - 1
+    bids = np.zeros(len(starts), dtype=np.int64)
+    for place in range(widths.max(initial=0)):
+        lines = np.flatnonzero(widths > place)
+        digits = buffer[starts[lines] + HAND_SIZE + 1 + place].astype(np.int64) - ord("0")
+        if ((digits < 0) | (digits > 9)).any():
+            raise ValueError("Bids must be whole numbers")
+        bids[lines] = bids[lines] * 10 + digits
+
+    # Line numbers in the low bits keep equal hands in input order and make a plain sort of ints enough
+    line_bits = max(len(starts) - 1, 0).bit_length()
+    ranked = np.sort(keys << line_bits | np.arange(len(starts))) & ((1 << line_bits) - 1)
+    return int((bids[ranked] * np.arange(1, len(ranked) + 1)).sum())
+
+
+def main():
+    print(solve_buffer(map_file("07/input.txt")))
 
 
 if __name__ == "__main__":
@@ -1,16 +1,24 @@
-from main import solve
+from main import calculate_rank, solve, solve_buffer
+
+EXAMPLE = [
+    "32T3K 765",
+    "T55J5 684",
+    "KK677 28",
+    "KTJJT 220",
+    "QQQJA 483",
+]
 
 
 def test_main():
-    assert (
-        solve(
-            [
-                "32T3K 765",
-                "T55J5 684",
-                "KK677 28",
-                "KTJJT 220",
-                "QQQJA 483",
-            ]
-        )
-        == 6440
-    )
+    assert solve(EXAMPLE) == 6440
+
+
+def test_buffer():
+    assert solve_buffer("\n".join(EXAMPLE).encode()) == 6440
+    assert solve_buffer("".join(line + "\r\n" for line in EXAMPLE).encode()) == 6440
+    assert solve_buffer(b"") == 0
+
+
+def test_rank():
+    hands = ["AAAAA", "AA8AA", "23332", "TTT98", "23432", "A23A4", "23456"]
+    assert [calculate_rank(hand) for hand in hands] == [6, 5, 4, 3, 2, 1, 0]
@@ -1,70 +1,71 @@
-from functools import reduce
+from collections import Counter
+from functools import cache
+from typing import Iterable, Iterator, Optional
 
+from utils.loader import text_lines
 
-def calculate_rank(cards: str):
-    count_by_type = sorted(
-        reduce(lambda acc, c: {**acc, c: acc.get(c, 0) + 1}, cards, {}).items(), key=lambda kv: kv[1], reverse=True
-    )
-    return (
-        6 if count_by_type[0][1] == 5 else
-        5 if count_by_type[0][1] == 4 else
-        4 if count_by_type[0][1] == 3 and count_by_type[1][1] == 2 else
-        3 if count_by_type[0][1] == 3 else
-        2 if count_by_type[0][1] == 2 and count_by_type[1][1] == 2 else
-        1 if count_by_type[0][1] == 2 else
-        0
-    )
+# Weakest first, the joker is wild and ranks lowest on its own
+CARDS = "J23456789TQKA"
+WILDCARDS = "J"
 
 
-def calculate_rank_with_joker(cards: str):
-    if cards == "JJJJJ":
-        return 6
+def partitions(n: int, largest: Optional[int] = None) -> Iterator[tuple[int, ...]]:
+    # Every way to split n cards into groups, as group sizes from largest to smallest
+    if n == 0:
+        yield ()
+        return
+    for first in range(min(n, largest or n), 0, -1):
+        for rest in partitions(n - first, first):
+            yield (first, *rest)
 
-    non_joker_cards = list(set(cards.replace("J", "")))
 
-    def generate_possible_hands(_cards: str):
-        if len(_cards) == 1:
-            if _cards[0] == "J":
-                return non_joker_cards
-            return [_cards[0]]
+@cache
+def hand_types(size: int) -> dict[tuple[int, ...], int]:
+    # Comparing group sizes largest first orders the hand types of any size: for five cards high card, one pair,
+    # two pair, three of a kind, full house, four and five of a kind get 0 to 6
+    return {groups: rank for rank, groups in enumerate(sorted(partitions(size)))}
 
-        rest_of_hands = generate_possible_hands(_cards[1:])
 
-        if _cards[0] != "J":
-            return [_cards[0] + h for h in rest_of_hands]
+def hand_groups(cards: str, wildcards: str = WILDCARDS) -> tuple[int, ...]:
+    # Wildcards do best joining the largest group of real cards, whatever the hand length or the set of wildcards
+    groups = sorted(Counter(c for c in cards if c not in wildcards).values(), reverse=True) or [0]
+    groups[0] += len(cards) - sum(groups)
+    return tuple(groups)
 
-        return [c + h for h in rest_of_hands for c in non_joker_cards]
 
-    return max([calculate_rank(h) for h in generate_possible_hands(cards)])
+def calculate_rank_with_joker(cards: str, wildcards: str = WILDCARDS):
+    return hand_types(len(cards))[hand_groups(cards, wildcards)]
 
 
-class Hand:
-    cards_ranked = ["J", "2", "3", "4", "5", "6", "7", "8", "9", "T", "Q", "K", "A"]
+@cache
+def card_values(order: str) -> dict[str, int]:
+    return {c: i for i, c in enumerate(order)}
 
-    def __init__(self, cards: str) -> None:
-        self._cards = cards
-        self._ranks = [self.cards_ranked.index(c) for c in cards]
-        self._rank = calculate_rank_with_joker(self._cards)
 
-    @property
-    def sorting_key(self):
-        return [self._rank, *self._ranks]
+def hand_key(cards: str, order: str = CARDS, wildcards: str = WILDCARDS) -> int:
+    # The hand type above one fixed width field per card, so keys sort like the hands do
+    bits = (len(order) - 1).bit_length()
+    values = card_values(order)
+    key = calculate_rank_with_joker(cards, wildcards)
+    for c in cards:
+        key = key << bits | values[c]
+    return key
 
-    def __repr__(self) -> str:
-        return f"Hand({self._cards})"
 
-
-def solve(input_lines: list[str]):
-    hands = [(Hand(sp[0]), int(sp[1])) for line in input_lines if (sp := line.split())]
-    ranked = sorted(hands, key=lambda h: h[0].sorting_key)
-    return sum([(i + 1) * hand[1] for i, hand in enumerate(ranked)])
+def solve(input_lines: Iterable[str]):
+    keys = []
+    bids = []
+    for line in input_lines:
+        if sp := line.split():
+            keys.append(hand_key(sp[0]))
+            bids.append(int(sp[1]))
+    # Sorting indices by key keeps equal hands in input order, as sorting the hands themselves would
+    ranked = sorted(range(len(keys)), key=keys.__getitem__)
+    return sum((rank + 1) * bids[i] for rank, i in enumerate(ranked))
 
 
 def main():
-    with open("07/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
-
-    print(solve(test_input))
+    print(solve(text_lines("07/input.txt")))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,8 @@
-from main import solve
+import random
+from collections import Counter
+from itertools import product
+
+from main import CARDS, calculate_rank_with_joker, hand_groups, solve
 
 
 def test_main():
@@ -14,3 +18,29 @@ def test_main():
         )
         == 5905
     )
+
+
+def test_rank():
+    hands = ["JJJJJ", "AJJJ2", "2233J", "2234J", "A23J4", "23456"]
+    assert [calculate_rank_with_joker(hand) for hand in hands] == [6, 5, 4, 3, 1, 0]
+
+
+def best_groups(cards: str, wildcards: str) -> tuple[int, ...]:
+    # Tries every card for every wildcard
+    wild = [i for i, c in enumerate(cards) if c in wildcards]
+    best = ()
+    for replacements in product(CARDS, repeat=len(wild)):
+        hand = list(cards)
+        for i, c in zip(wild, replacements):
+            hand[i] = c
+        best = max(best, tuple(sorted(Counter(hand).values(), reverse=True)))
+    return best
+
+
+def test_wildcards():
+    rng = random.Random(7)
+    for size, wildcards in [(5, "J"), (6, "J2"), (7, "JQK")]:
+        for _ in range(300):
+            cards = "".join(rng.choices(CARDS, k=size))
+            if sum(c in wildcards for c in cards) <= 3:
+                assert hand_groups(cards, wildcards) == best_groups(cards, wildcards)
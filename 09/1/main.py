@@ -1,3 +1,8 @@
+from typing import Iterable
+
+from utils.loader import text_lines
+
+
 class Sequence:
     def __init__(self, values: list[int]):
         self._values = values
@@ -24,15 +29,12 @@ class Sequence:
         return self._values[-1]
 
 
-def solve(input_lines: list[str]):
+def solve(input_lines: Iterable[str]):
     return sum(Sequence.from_input(line).extend().last for line in input_lines)
 
 
 def main():
-    with open("09/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
-
-    print(solve(test_input))
+    print(solve(text_lines("09/input.txt")))
 
 
 if __name__ == "__main__":
@@ -1,3 +1,8 @@
+from typing import Iterable
+
+from utils.loader import text_lines
+
+
 def hash(s: str):
     value = 0
     for c in s:
@@ -7,17 +12,14 @@ def hash(s: str):
     return value
 
 
-def solve(input_lines: list[str]):
-    values = input_lines[0].split(",")
+def solve(input_lines: Iterable[str]):
+    values = next(iter(input_lines)).split(",")
 
     return sum(map(hash, values))
 
 
 def main():
-    with open("15/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
-
-    print(solve(test_input))
+    print(solve(text_lines("15/input.txt")))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
 import re
+from typing import Iterable
+
+from utils.loader import text_lines
 
 
 def hash(s: str):
@@ -10,9 +13,9 @@ def hash(s: str):
     return value
 
 
-def solve(input_lines: list[str]):
+def solve(input_lines: Iterable[str]):
     inst_re = re.compile(r"^(?P<label>\w+)(?P<inst>[-=])(?P<num>\d+)?$")
-    values = list(map(inst_re.match, input_lines[0].split(",")))
+    values = list(map(inst_re.match, next(iter(input_lines)).split(",")))
 
     boxes: dict[int, list[tuple[str, int]]] = {i: [] for i in range(256)}
 
@@ -38,10 +41,7 @@ def solve(input_lines: list[str]):
 
 
 def main():
-    with open("15/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
-
-    print(solve(test_input))
+    print(solve(text_lines("15/input.txt")))
 
 
 if __name__ == "__main__":
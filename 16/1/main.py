@@ -1,17 +1,20 @@
-Point = tuple[int, int]
+from collections import deque
+
+from utils.grid import PADDING, Grid
+
 Dir = str
 
 dir_to_offset = {">": (1, 0), "<": (-1, 0), "^": (0, -1), "v": (0, 1)}
 
 
-class Grid:
+class Tile:
     def apply(self, dir: Dir):
         assert dir in dir_to_offset
         return [(dir, dir_to_offset[dir])]
 
 
 # |
-class VerticalSplitter(Grid):
+class VerticalSplitter(Tile):
     def apply(self, dir: Dir):
         if dir in "v^":
             return [(dir, dir_to_offset[dir])]
@@ -20,7 +23,7 @@ class VerticalSplitter(Grid):
 
 
 # -
-class HorizontalSplitter(Grid):
+class HorizontalSplitter(Tile):
     def apply(self, dir: Dir):
         if dir in "><":
             return [(dir, dir_to_offset[dir])]
@@ -29,7 +32,7 @@ class HorizontalSplitter(Grid):
 
 
 # /
-class ForwardMirror(Grid):
+class ForwardMirror(Tile):
     def apply(self, dir: Dir):
         mapping = {">": "^", "<": "v", "^": ">", "v": "<"}
 
@@ -38,7 +41,7 @@ class ForwardMirror(Grid):
 
 
 # \
-class BackwardMirror(Grid):
+class BackwardMirror(Tile):
     def apply(self, dir: Dir):
         mapping = {">": "v", "<": "^", "^": "<", "v": ">"}
 
@@ -46,32 +49,45 @@ class BackwardMirror(Grid):
         return [(mapped, dir_to_offset[mapped])]
 
 
-grid_types = {
-    ".": Grid(),
+tile_types = {
+    ".": Tile(),
     "|": VerticalSplitter(),
     "-": HorizontalSplitter(),
     "/": ForwardMirror(),
     "\\": BackwardMirror(),
 }
 
+# In the order of utils.grid.STEPS
+dirs = "^>v<"
 
-def solve(input_lines: list[str]):
-    grid: dict[Point, Grid] = {(x, y): grid_types[c] for y, line in enumerate(input_lines) for x, c in enumerate(line)}
+# Byte value of a tile -> incoming direction -> outgoing directions
+transitions = {
+    ord(c): [tuple(dirs.index(d) for d, _ in tile.apply(dir)) for dir in dirs] for c, tile in tile_types.items()
+}
 
-    visited: set[tuple[Point, Dir]] = set()
-    queue: list[tuple[Point, Dir]] = [((0, 0), ">")]
 
-    while any(queue):
-        point, dir = queue.pop(0)
-        visited.add((point, dir))
-        for new_dir, offset in grid[point].apply(dir):
-            new_point = (point[0] + offset[0], point[1] + offset[1])
-            if (new_point, new_dir) not in visited and new_point in grid:
-                queue.append((new_point, new_dir))
+def evaluate(grid: Grid, tiles: bytes, start: tuple[int, int]):
+    # One byte per cell holding a bit for each direction a beam has passed through it in
+    visited = bytearray(len(tiles))
+    queue = deque([start])
 
-    energised: set[Point] = set([point for point, _ in visited])
+    while queue:
+        index, dir = queue.popleft()
+        if visited[index] & (1 << dir):
+            continue
+        visited[index] |= 1 << dir
+        for new_dir in transitions[tiles[index]][dir]:
+            new_index = index + grid.offsets[new_dir]
+            if tiles[new_index] != PADDING and not visited[new_index] & (1 << new_dir):
+                queue.append((new_index, new_dir))
+
+    return len(visited) - visited.count(0)
+
+
+def solve(input_lines: list[str]):
+    grid = Grid.from_lines(input_lines)
 
-    return len(energised)
+    return evaluate(grid, grid.flat.tobytes(), (grid.index(0, 0), dirs.index(">")))
 
 
 def main():
@@ -1,17 +1,20 @@
-Point = tuple[int, int]
+from collections import deque
+
+from utils.grid import PADDING, Grid
+
 Dir = str
 
 dir_to_offset = {">": (1, 0), "<": (-1, 0), "^": (0, -1), "v": (0, 1)}
 
 
-class Grid:
+class Tile:
     def apply(self, dir: Dir):
         assert dir in dir_to_offset
         return [(dir, dir_to_offset[dir])]
 
 
 # |
-class VerticalSplitter(Grid):
+class VerticalSplitter(Tile):
     def apply(self, dir: Dir):
         if dir in "v^":
             return [(dir, dir_to_offset[dir])]
@@ -20,7 +23,7 @@ class VerticalSplitter(Grid):
 
 
 # -
-class HorizontalSplitter(Grid):
+class HorizontalSplitter(Tile):
     def apply(self, dir: Dir):
         if dir in "><":
             return [(dir, dir_to_offset[dir])]
@@ -29,7 +32,7 @@ class HorizontalSplitter(Grid):
 
 
 # /
-class ForwardMirror(Grid):
+class ForwardMirror(Tile):
     def apply(self, dir: Dir):
         mapping = {">": "^", "<": "v", "^": ">", "v": "<"}
 
@@ -38,7 +41,7 @@ class ForwardMirror(Grid):
 
 
 # \
-class BackwardMirror(Grid):
+class BackwardMirror(Tile):
     def apply(self, dir: Dir):
         mapping = {">": "v", "<": "^", "^": "<", "v": ">"}
 
@@ -46,41 +49,53 @@ class BackwardMirror(Grid):
         return [(mapped, dir_to_offset[mapped])]
 
 
-grid_types = {
-    ".": Grid(),
+tile_types = {
+    ".": Tile(),
     "|": VerticalSplitter(),
     "-": HorizontalSplitter(),
     "/": ForwardMirror(),
     "\\": BackwardMirror(),
 }
 
+# In the order of utils.grid.STEPS
+dirs = "^>v<"
+
+# Byte value of a tile -> incoming direction -> outgoing directions
+transitions = {
+    ord(c): [tuple(dirs.index(d) for d, _ in tile.apply(dir)) for dir in dirs] for c, tile in tile_types.items()
+}
+
 
-def evaluate(grid: dict[Point, Grid], start: tuple[Point, Dir]):
-    visited: set[tuple[Point, Dir]] = set()
-    queue: list[tuple[Point, Dir]] = [start]
+def evaluate(grid: Grid, tiles: bytes, start: tuple[int, int]):
+    # One byte per cell holding a bit for each direction a beam has passed through it in
+    visited = bytearray(len(tiles))
+    queue = deque([start])
 
-    while any(queue):
-        point, dir = queue.pop(0)
-        visited.add((point, dir))
-        for new_dir, offset in grid[point].apply(dir):
-            new_point = (point[0] + offset[0], point[1] + offset[1])
-            if (new_point, new_dir) not in visited and new_point in grid:
-                queue.append((new_point, new_dir))
+    while queue:
+        index, dir = queue.popleft()
+        if visited[index] & (1 << dir):
+            continue
+        visited[index] |= 1 << dir
+        for new_dir in transitions[tiles[index]][dir]:
+            new_index = index + grid.offsets[new_dir]
+            if tiles[new_index] != PADDING and not visited[new_index] & (1 << new_dir):
+                queue.append((new_index, new_dir))
 
-    return len(set([point for point, _ in visited]))
+    return len(visited) - visited.count(0)
 
 
 def solve(input_lines: list[str]):
-    grid: dict[Point, Grid] = {(x, y): grid_types[c] for y, line in enumerate(input_lines) for x, c in enumerate(line)}
+    grid = Grid.from_lines(input_lines)
+    tiles = grid.flat.tobytes()
 
     starts = [
-        *[((0, i), ">") for i in range(len(input_lines))],
-        *[((len(input_lines[0]) - 1, i), "<") for i in range(len(input_lines))],
-        *[((i, 0), "v") for i in range(len(input_lines[0]))],
-        *[((i, len(input_lines) - 1), "^") for i in range(len(input_lines[0]))],
+        *[(grid.index(0, i), dirs.index(">")) for i in range(grid.height)],
+        *[(grid.index(grid.width - 1, i), dirs.index("<")) for i in range(grid.height)],
+        *[(grid.index(i, 0), dirs.index("v")) for i in range(grid.width)],
+        *[(grid.index(i, grid.height - 1), dirs.index("^")) for i in range(grid.width)],
     ]
 
-    return max(evaluate(grid, start) for start in starts)
+    return max(evaluate(grid, tiles, start) for start in starts)
 
 
 def main():
@@ -1,8 +1,11 @@
 import math
 from queue import PriorityQueue
 
+import numpy as np
+
+from utils.grid import PADDING, Grid
+
 
-Point = tuple[int, int]
 Step = tuple[int, int]
 
 STEP_NORTH: Step = (0, -1)
@@ -29,15 +32,18 @@ def _get_next_steps(prev_step: Step, prev_step_count: int) -> tuple[Step, ...]:
     return tuple(step for step in valid_next_steps if step != prev_step)
 
 
-State = tuple[Point, Step, int]
+State = tuple[int, Step, int]
 
 
 def solve(input_lines: list[str]):
-    grid: dict[Point, int] = {(x, y): int(c) for y, line in enumerate(input_lines) for x, c in enumerate(line)}
+    grid = Grid.from_lines(input_lines)
+    heat = grid.lookup({c: int(c) for c in "123456789"}, default=PADDING, dtype=np.uint8).tobytes()
+    offsets = {step: grid.offset(step) for step in ALL_STEPS}
     frontier: PriorityQueue[tuple[int, int, State]] = PriorityQueue()
-    frontier.put((0, 0, ((0, 0), STEP_SOUTH, 0)))
+    frontier.put((0, 0, (grid.index(0, 0), STEP_SOUTH, 0)))
     seen_states: dict[State, int] = {}
-    goal = (len(input_lines[0]) - 1, len(input_lines) - 1)
+    goal_x, goal_y = grid.width - 1, grid.height - 1
+    goal = grid.index(goal_x, goal_y)
 
     while frontier:
         _, heat_loss, state = frontier.get()
@@ -46,10 +52,10 @@ def solve(input_lines: list[str]):
         valid_next_steps = _get_next_steps(prev_step, prev_step_count)
 
         for step in valid_next_steps:
-            new_location = (location[0] + step[0], location[1] + step[1])
-            if new_location not in grid:
+            new_location = location + offsets[step]
+            if (point_loss := heat[new_location]) == PADDING:
                 continue
-            new_heat_loss = heat_loss + grid[new_location]
+            new_heat_loss = heat_loss + point_loss
 
             if new_location == goal:
                 return new_heat_loss
@@ -60,7 +66,8 @@ def solve(input_lines: list[str]):
                 continue
             seen_states[next_state] = new_heat_loss
 
-            fitness = new_heat_loss + abs(goal[0] - new_location[0]) + abs(goal[1] - new_location[1])
+            x, y = grid.point(new_location)
+            fitness = new_heat_loss + goal_x - x + goal_y - y
             frontier.put((fitness, new_heat_loss, next_state))
 
 
@@ -3,8 +3,11 @@ import math
 from queue import PriorityQueue
 from typing import Mapping, Union
 
+import numpy as np
+
+from utils.grid import PADDING, Grid
+
 
-Point = tuple[int, int]
 Step = tuple[int, int]
 
 STEP_NORTH: Step = (0, -1)
@@ -24,16 +27,19 @@ MIN_STEPS = 4
 MAX_STEPS = 10
 
 
-State = tuple[Point, Step]
+State = tuple[int, Step]
 
 
 def solve(input_lines: list[str]):
-    grid: dict[Point, int] = {(x, y): int(c) for y, line in enumerate(input_lines) for x, c in enumerate(line)}
+    grid = Grid.from_lines(input_lines)
+    heat = grid.lookup({c: int(c) for c in "123456789"}, default=PADDING, dtype=np.uint8).tobytes()
+    offsets = {step: grid.offset(step) for step in ALL_STEPS}
     frontier: PriorityQueue[tuple[int, int, State]] = PriorityQueue()
-    frontier.put((0, 0, ((0, 0), STEP_SOUTH)))
-    frontier.put((0, 0, ((0, 0), STEP_EAST)))
+    frontier.put((0, 0, (grid.index(0, 0), STEP_SOUTH)))
+    frontier.put((0, 0, (grid.index(0, 0), STEP_EAST)))
     seen_states: Mapping[State, Union[int, float]] = defaultdict(lambda: math.inf)
-    goal = (len(input_lines[0]) - 1, len(input_lines) - 1)
+    goal_x, goal_y = grid.width - 1, grid.height - 1
+    goal = grid.index(goal_x, goal_y)
 
     while not frontier.empty():
         _, heat_loss, state = frontier.get()
@@ -47,9 +53,10 @@ def solve(input_lines: list[str]):
 
         for direction in VALID_NEXT_DIRECTION[prev_step]:
             new_heat_loss = heat_loss
+            new_location = location
             for dist in range(1, MAX_STEPS + 1):
-                new_location = (location[0] + direction[0] * dist, location[1] + direction[1] * dist)
-                if (point_loss := grid.get(new_location)) is None:
+                new_location += offsets[direction]
+                if (point_loss := heat[new_location]) == PADDING:
                     break
                 new_heat_loss += point_loss
                 if dist < MIN_STEPS:
@@ -61,7 +68,8 @@ def solve(input_lines: list[str]):
                     continue
                 seen_states[next_state] = new_heat_loss
 
-                new_fitness = new_heat_loss + abs(goal[0] - new_location[0]) + abs(goal[1] - new_location[1])
+                x, y = grid.point(new_location)
+                new_fitness = new_heat_loss + goal_x - x + goal_y - y
                 frontier.put((new_fitness, new_heat_loss, next_state))
 
 
@@ -2,8 +2,6 @@ from dataclasses import dataclass
 import enum
 from abc import ABC, abstractmethod
 from typing import Callable, Optional
-import networkx as nx
-import matplotlib.pyplot as plt
 import math
 
 
@@ -174,6 +172,10 @@ def simulate(network: dict[str, Node]):
 
 
 def draw_network(network: dict[str, Node], leaf_count: int = 4):
+    # Only needed for debugging, importing these takes longer than solving
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.DiGraph()
     next_nodes = ["broadcaster"]
     seen_nodes = set()
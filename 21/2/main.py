@@ -2,7 +2,10 @@
 from itertools import product
 import math
 from queue import PriorityQueue
-import json
+
+import numpy as np
+
+from utils.grid import Grid
 
 V2 = tuple[int, int]
 
@@ -64,37 +67,19 @@ def walk_with_boundaries(grid: set[V2], start: list[V2], size: V2, boundaries: d
     return seen, leaving_points
 
 
-def walk_limited(grid: set[V2], start: list[V2], n: int):
-    explore: PriorityQueue[tuple[int, V2]] = PriorityQueue()
-
-    for p in start:
-        explore.put((0, p))
-
-    seen = set()
-
-    while not explore.empty():
-        depth, point = explore.get()
-        if point in seen:
-            continue
-        if point not in grid:
+def walk_limited(garden: Grid, start: list[V2], n: int) -> int:
+    passable = garden.mask(".S")
+    y, x = np.divmod(np.arange(garden.flat.size), garden.stride)
+    parity = (x + y) % 2
+    count = 0
+    # Plots are reached in pairs of steps, so only start points of the same colour on the checkerboard count together
+    for colour in (0, 1):
+        sources = [garden.index(x, y) for x, y in start if garden.contains(x, y) and (x + y) % 2 == colour]
+        if not sources:
             continue
-        seen.add(point)
-
-        for step1, step2 in product(DIRECTIONS, repeat=2):
-            mid_point = (point[0] + step1[0], point[1] + step1[1])
-            if mid_point not in grid:
-                continue
-            new_point = (mid_point[0] + step2[0], mid_point[1] + step2[1])
-
-            if new_point not in grid:
-                continue
-            if new_point in seen:
-                continue
-            if depth + 2 > n:
-                continue
-            explore.put((depth + 2, new_point))
-
-    return seen
+        distance = garden.distances(sources, passable, limit=n)
+        count += int(np.count_nonzero((distance >= 0) & (distance % 2 == 0) & (parity == colour)))
+    return count
 
 
 def walk_unlimited(grid: set[V2], start: list[V2], size: V2, n: int = 66):
@@ -131,15 +116,6 @@ def walk_unlimited(grid: set[V2], start: list[V2], size: V2, n: int = 66):
     return seen
 
 
-def load_boundaries() -> dict[V2, dict[str, tuple[int, list[V2]]]]:
-    with open("21/.cache/cache.json") as f:
-        data = json.load(f)
-    return {
-        tuple(map(int, k.split(","))): {kk: (vv[0], list(map(tuple, vv[1]))) for kk, vv in v.items()}
-        for k, v in data.items()
-    }  # type: ignore
-
-
 NO_RETURN = {
     "TOP": "BOTTOM",
     "BOTTOM": "TOP",
@@ -171,13 +147,6 @@ def find_boundary_entries(grid: set[V2], size: V2, boundaries: dict[str, set[V2]
                     continue
                 explore.append(p)
 
-    with open("21/cache.json", "w") as f:
-        json.dump(
-            {",".join(map(str, k)): {d: (vv[0], list(vv[1])) for d, vv in v.items()} for k, v in results.items()},
-            f,
-            indent=4,
-        )
-
     return results
 
 
@@ -257,9 +226,9 @@ def count_fill(grid: set[V2], start: frozenset[V2]) -> int:
 
 
 def solve(input_lines: list[str], n=26501365):
-    grid = {(x, y) for y, line in enumerate(input_lines) for x, c in enumerate(line) if c != "#"}
-    start = next((x, y) for y, line in enumerate(input_lines) for x, c in enumerate(line) if c == "S")
-    size = (len(input_lines[0]), len(input_lines))
+    garden = Grid.from_lines(input_lines)
+    start = garden.point(garden.find("S"))
+    size = (garden.width, garden.height)
     boundaries = {
         "TOP": {(x, y) for x in range(size[0]) for y in (-1, -2)},
         "BOTTOM": {(x, y) for x in range(size[0]) for y in (size[1], size[1] + 1)},
@@ -269,19 +238,13 @@ def solve(input_lines: list[str], n=26501365):
 
     start_points = [(start[0] + d[0], start[1] + d[1]) for d in DIRECTIONS]
     # r = find_boundary_entries(grid, size, boundaries, start_points)
-    # boundary_steps = load_boundaries()
-    # expanson_points = find_expanson_pattern(boundary_steps, start_points)
+    # expanson_points = find_expanson_pattern(r, start_points)
 
     # frontier = PriorityQueue()
     # frontier.put((1, (0, 0), (frozenset(start_points), (0, 0)), count_fill(grid, frozenset(start_points))))
 
     # visited = {}
 
-    # with open("21/.cache/fill_cache.json") as f:
-    #     data = json.load(f)
-    #     for points, val in data:
-    #         fill_cache[frozenset(list(map(tuple, points)))] = val
-
     # while not frontier.empty():
     #     cost, p, leaving, fill = frontier.get()
     #     if visited.get(p, [math.inf])[0] <= cost:
@@ -346,7 +309,7 @@ def solve(input_lines: list[str], n=26501365):
     total = 0
 
     if n < 128:
-        total += len(walk_limited(grid, start_points, n))
+        total += walk_limited(garden, start_points, n)
     else:
         total += 7407
 
@@ -354,26 +317,26 @@ def solve(input_lines: list[str], n=26501365):
         diag_a_full = diagonal_a_total - diagonal_a_last
         total += diag_a_full * 4 * 7407
         diag_a_steps = n - ((diagonal_a_n * 262) - 129)
-        diag_a_final_walks = [walk_limited(grid, p, diag_a_steps) for p in diagonal_a_entries]
-        total += sum(map(len, diag_a_final_walks)) * diagonal_a_last
+        diag_a_final_walks = [walk_limited(garden, p, diag_a_steps) for p in diagonal_a_entries]
+        total += sum(diag_a_final_walks) * diagonal_a_last
     if n >= 263:
         diag_b_full = diagonal_b_total - diagonal_b_last
         total += diag_b_full * 4 * 7481
         diag_b_steps = n - ((diagonal_b_n * 262) + 1)
-        diag_b_final_walks = [walk_limited(grid, p, diag_b_steps) for p in diagonal_b_entries]
-        total += sum(map(len, diag_b_final_walks)) * diagonal_b_last
+        diag_b_final_walks = [walk_limited(garden, p, diag_b_steps) for p in diagonal_b_entries]
+        total += sum(diag_b_final_walks) * diagonal_b_last
     if n >= 67:
         straight_a_full = straight_a_n - 1
         total += straight_a_full * 4 * 7481
         straight_a_steps = n - ((straight_a_n * 262) - 195)
-        straight_a_final_walks = [walk_limited(grid, p, straight_a_steps) for p in straight_a_entries]
-        total += sum(map(len, straight_a_final_walks))
+        straight_a_final_walks = [walk_limited(garden, p, straight_a_steps) for p in straight_a_entries]
+        total += sum(straight_a_final_walks)
     if n >= 197:
         straight_b_full = straight_b_n - 1
         total += straight_b_full * 4 * 7407
         straight_b_steps = n - ((straight_b_n * 262) - 65)
-        straight_b_final_walks = [walk_limited(grid, p, straight_b_steps) for p in straight_b_entries]
-        total += sum(map(len, straight_b_final_walks))
+        straight_b_final_walks = [walk_limited(garden, p, straight_b_steps) for p in straight_b_entries]
+        total += sum(straight_b_final_walks)
 
     # seen = walk_unlimited(grid, start_points, size, n=n)
 
@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-import networkx as nx
 
 
 V2 = tuple[int, int]
@@ -67,6 +66,9 @@ def build_segments(grid: dict[V2, str], start: V2, goal: V2):
 
 
 def solve(input_lines: list[str]):
+    # Imported here so loading the module stays cheap
+    import networkx as nx
+
     grid = {(x, y): c for y, line in enumerate(input_lines) for x, c in enumerate(line) if c != "#"}
 
     start = (1, 0)
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import Iterable, Optional
 from itertools import combinations
 
+from utils.loader import text_lines
+
 
 class Line:
     def __init__(self, line: str):
@@ -48,7 +50,7 @@ def get_intersection(l1: Line, l2: Line) -> Optional[tuple[float, float]]:
     return (numerator_x / denominator, numerator_y / denominator)
 
 
-def solve(input_lines: list[str], min_v: int = 200000000000000, max_v: int = 400000000000000):
+def solve(input_lines: Iterable[str], min_v: int = 200000000000000, max_v: int = 400000000000000):
     lines = list(map(Line, input_lines))
 
     count = 0
@@ -66,10 +68,7 @@ def solve(input_lines: list[str], min_v: int = 200000000000000, max_v: int = 400
 
 
 def main():
-    with open("24/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
-
-    print(solve(test_input))
+    print(solve(text_lines("24/input.txt")))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
-import sympy
+from itertools import islice
+from typing import Iterable
+
+from utils.loader import text_lines
 
 
 class Line:
@@ -19,8 +22,12 @@ class Line:
         return self.vx, self.vy, self.vz
 
 
-def solve(input_lines: list[str]):
-    lines = list(map(Line, input_lines))
+def solve(input_lines: Iterable[str]):
+    # Three hailstones pin down the rock, the rest of the input is never read
+    lines = list(map(Line, islice(input_lines, 3)))
+
+    # Imported here so loading the module stays cheap
+    import sympy
 
     sx, sy, sz = sympy.var("sx"), sympy.var("sy"), sympy.var("sz")
 
@@ -28,7 +35,7 @@ def solve(input_lines: list[str]):
 
     eq = []
 
-    for i, line in enumerate(lines[:3]):
+    for i, line in enumerate(lines):
         ti = sympy.var("t{}".format(i))
 
         eq.append(sympy.Eq(sx + vx * ti, line.x + line.vx * ti))
@@ -40,10 +47,7 @@ def solve(input_lines: list[str]):
 
 
 def main():
-    with open("24/input.txt") as f:
-        test_input = list(map(lambda line: line.strip(), f.readlines()))
-
-    print(solve(test_input))
+    print(solve(text_lines("24/input.txt")))
 
 
 if __name__ == "__main__":
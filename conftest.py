@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Solvers import shared helpers from utils, so the repository root has to be importable when running from a day folder
+sys.path.insert(0, os.path.dirname(__file__))
@@ -3,6 +3,33 @@ import click
 import requests
 from datetime import datetime
 import os
+import time
+
+from utils.cache import DEFAULT_CACHE, DEFAULT_CACHE_SIZE, ResultCache, cache_key
+from utils.generators import GENERATORS, generate
+from utils.loader import MappedLines
+from utils.profiler import DEFAULT_INTERVAL, Sampler, profile_functions
+from utils.benchmark import (
+    DEFAULT_BASELINE,
+    benchmark_solver,
+    find_regressions,
+    load_baseline,
+    measure_import_time,
+    save_baseline,
+)
+from utils.runner import (
+    ALL_PARTS,
+    STREAMING_DAYS,
+    RunResult,
+    available_solvers,
+    input_path,
+    load_solver,
+    longest_first,
+    parse_days,
+    read_input,
+    run_parallel,
+    run_solver,
+)
 
 
 @click.group()
@@ -105,5 +132,260 @@ def part_two(day: int):
     shutil.copy2(f"{padded}/1/main.py", f"{padded}/2/main.py")
 
 
+def input_options(default_day: str):
+    def _decorate(fn):
+        fn = click.option("--shape", type=str, default=None, help="Use a synthetic input of this named shape")(fn)
+        fn = click.option("--seed", type=int, default=0, help="Seed for synthetic inputs")(fn)
+        fn = click.option("--scale", type=int, default=None, help="Use a synthetic input scaled by this factor")(fn)
+        fn = click.option("--input", "input_file", type=click.Path(exists=True, dir_okay=False), default=None)(fn)
+        fn = click.option("--part", type=click.Choice(["1", "2"]), default=None)(fn)
+        fn = click.option("--day", type=str, default=default_day, help="Day or range of days, e.g. 1-5,7")(fn)
+        return fn
+
+    return _decorate
+
+
+def solver_inputs(day: str, part: str, input_file: str, scale: int, seed: int, shape: str, stream: bool = False):
+    days = parse_days(day)
+    parts = [int(part)] if part else ALL_PARTS
+
+    for solver_day in days:
+        solvers = available_solvers([solver_day], parts)
+        if not solvers:
+            continue
+
+        if scale or shape:
+            input_lines = generate(solver_day, scale or 1, seed, shape)
+        else:
+            path = input_file or input_path(solver_day)
+            if not os.path.isfile(path):
+                print(f"Day {solver_day:02}: no input at {path}. Skipping")
+                continue
+            input_lines = MappedLines(path) if stream and solver_day in STREAMING_DAYS else read_input(path)
+
+        for solver_day, solver_part in solvers:
+            yield solver_day, solver_part, input_lines
+
+
+@cli.command()
+@input_options(default_day=str(datetime.now().day))
+@click.option("--jobs", type=int, default=1, help="Run solvers in this many worker processes, 0 for one per core")
+@click.option("--baseline", type=click.Path(dir_okay=False), default=DEFAULT_BASELINE, help="Timings for scheduling")
+@click.option("--stream", is_flag=True, help="Stream input files from disk to line based solvers instead of reading")
+@click.option("--cache/--no-cache", default=True, help="Reuse results of unchanged solvers on unchanged inputs")
+@click.option("--cache-file", type=click.Path(dir_okay=False), default=DEFAULT_CACHE)
+@click.option("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="Bytes of results to keep before evicting")
+@click.option("--memory", is_flag=True, help="Trace allocations to report peak memory and the top allocation sites")
+@click.option("--batch", is_flag=True, help="Hand solvers that support it the whole input as bytes, implies --stream")
+@click.option(
+    "--workers",
+    type=int,
+    default=0,
+    help="Split input files between this many processes in solvers that support it, implies --stream",
+)
+def run(
+    day: str,
+    part: str,
+    input_file: str,
+    scale: int,
+    seed: int,
+    shape: str,
+    jobs: int,
+    baseline: str,
+    stream: bool,
+    cache: bool,
+    cache_file: str,
+    cache_size: int,
+    memory: bool,
+    batch: bool,
+    workers: int,
+):
+    stream = stream or batch or bool(workers)
+    # Cached results carry no memory measurements
+    results = ResultCache(cache_file, cache_size) if cache and not memory else None
+    keys: dict[tuple[int, int], str] = {}
+
+    def uncached(tasks):
+        for solver_day, solver_part, input_lines in tasks:
+            if results is not None:
+                key = keys[(solver_day, solver_part)] = cache_key(solver_day, solver_part, input_lines)
+                if (hit := results.lookup(solver_day, solver_part, key)) is not None:
+                    print(hit)
+                    continue
+            yield solver_day, solver_part, input_lines
+
+    def finished(result: RunResult):
+        if results is not None:
+            results.store(keys[(result.day, result.part)], result)
+        print(result)
+        for site in result.allocations:
+            print(f"    {site}")
+
+    if jobs == 1:
+        for solver_day, solver_part, input_lines in uncached(
+            solver_inputs(day, part, input_file, scale, seed, shape, stream)
+        ):
+            finished(run_solver(solver_day, solver_part, input_lines, memory, batch, workers))
+        return
+
+    expected = {key: result["median"] for key, result in load_baseline(baseline).items()}
+    tasks = list(uncached(solver_inputs(day, part, input_file, scale, seed, shape, stream)))
+    # Scheduled by the benchmark of the same input and mode, a synthetic input replaces the input file
+    tasks = longest_first(tasks, expected, scale, shape, None if scale or shape else input_file, batch)
+
+    start = time.perf_counter()
+    total = 0.0
+    for solver_day, solver_part, result in run_parallel(tasks, jobs or None, memory, batch, workers):
+        if isinstance(result, BaseException):
+            print(f"Day {solver_day:02} part {solver_part}: failed with {type(result).__name__}: {result}")
+            continue
+        total += result.wall_time
+        finished(result)
+    print(f"Finished {len(tasks)} solvers in {time.perf_counter() - start:.2f} s, {total:.2f} s of solver time")
+
+
+@cli.command()
+@input_options(default_day="1-25")
+@click.option("--repeats", type=int, default=5)
+@click.option("--warmup", type=int, default=1)
+@click.option("--baseline", type=click.Path(dir_okay=False), default=DEFAULT_BASELINE)
+@click.option("--threshold", type=float, default=0.2, help="Allowed median slowdown before failing, e.g. 0.2 for 20%")
+@click.option("--memory-threshold", type=float, default=0.1, help="Allowed peak memory growth before failing")
+@click.option("--save", is_flag=True, help="Store the results as the new baseline instead of comparing")
+@click.option("--batch", is_flag=True, help="Hand solvers that support it the whole input as bytes")
+@click.option(
+    "--expect-error",
+    is_flag=True,
+    help="Time solvers up to the ValueError they raise on malformed input, e.g. --shape adversarial",
+)
+def benchmark(
+    day: str,
+    part: str,
+    input_file: str,
+    scale: int,
+    seed: int,
+    shape: str,
+    repeats: int,
+    warmup: int,
+    baseline: str,
+    threshold: float,
+    memory_threshold: float,
+    save: bool,
+    batch: bool,
+    expect_error: bool,
+):
+    stored = load_baseline(baseline)
+    results = []
+    regressions = []
+    for solver_day, solver_part, input_lines in solver_inputs(day, part, input_file, scale, seed, shape):
+        result = benchmark_solver(
+            solver_day,
+            solver_part,
+            input_lines,
+            repeats=repeats,
+            warmup=warmup,
+            scale=scale,
+            batch=batch,
+            # A synthetic input replaces the input file
+            input_file=None if scale or shape else input_file,
+            shape=shape,
+            expect_error=expect_error,
+        )
+        results.append(result)
+        print(result)
+        # Solvers can describe what they did with the input, e.g. sizes of intermediate results
+        module = load_solver(solver_day, solver_part)
+        if hasattr(module, "stats") and not expect_error:
+            for name, value in module.stats(list(input_lines)).items():
+                print(f"  {name}: {value}")
+        if save:
+            continue
+        for regression in find_regressions(result, stored, threshold, memory_threshold):
+            regressions.append(regression)
+            print(regression)
+
+    if save:
+        save_baseline(baseline, results)
+        print(f"Saved {len(results)} results to {baseline}")
+    elif regressions:
+        raise click.ClickException(f"{len(regressions)} regression(s) beyond the allowed thresholds")
+
+
+@cli.command()
+@click.option("--day", type=str, default="1-25", help="Day or range of days, e.g. 1-5,7")
+@click.option("--part", type=click.Choice(["1", "2"]), default=None)
+@click.option("--top", type=int, default=3, help="Number of heaviest imports to show")
+def startup(day: str, part: str, top: int):
+    for solver_day, solver_part in available_solvers(parse_days(day), [int(part)] if part else ALL_PARTS):
+        total, modules = measure_import_time(solver_day, solver_part)
+        heaviest = ", ".join(f"{name} {seconds * 1000:.2f} ms" for name, seconds in modules[:top])
+        summary = f"Day {solver_day:02} part {solver_part}: imports {total * 1000:.2f} ms"
+        print(summary + (f" ({heaviest})" if heaviest else ""))
+
+
+@cli.command()
+@input_options(default_day=str(datetime.now().day))
+@click.option("--top", type=int, default=20, help="Number of functions and lines to show")
+@click.option("--sample", "sampling", is_flag=True, help="Also run the solver under the sampling profiler")
+@click.option("--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between samples")
+@click.option(
+    "--collapsed",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write sampled stacks in collapsed format for flamegraph tools, implies --sample. {day} and {part} in the"
+    " path are replaced for each solver",
+)
+def profile(
+    day: str,
+    part: str,
+    input_file: str,
+    scale: int,
+    seed: int,
+    shape: str,
+    top: int,
+    sampling: bool,
+    interval: float,
+    collapsed: str,
+):
+    for solver_day, solver_part, input_lines in solver_inputs(day, part, input_file, scale, seed, shape):
+        module = load_solver(solver_day, solver_part)
+
+        result, functions = profile_functions(module.solve, list(input_lines))
+        print(f"Day {solver_day:02} part {solver_part}: {result}")
+        print(f"{'self ms':>10} {'cum ms':>10} {'calls':>10}  function")
+        for stats in functions[:top]:
+            print(stats)
+
+        if not (sampling or collapsed):
+            continue
+
+        # Separate run, cProfile's per call overhead would skew the samples
+        sampler = Sampler(interval)
+        sampler.run(load_solver(solver_day, solver_part).solve, list(input_lines))
+        print(f"{'samples':>8} {'share':>7}  line")
+        for line in sampler.hot_lines()[:top]:
+            print(line)
+
+        if collapsed:
+            path = collapsed.format(day=f"{solver_day:02}", part=solver_part)
+            sampler.write_collapsed(path)
+            print(f"Wrote {sampler.total} samples to {path}")
+
+
+@cli.command(name="generate")
+@click.option("--day", type=str, default="1-25", help="Day or range of days, e.g. 1-5,7")
+@click.option("--scale", type=int, default=10)
+@click.option("--seed", type=int, default=0)
+@click.option("--shape", type=str, default=None, help="Named shape of input, e.g. adversarial")
+def generate_inputs(day: str, scale: int, seed: int, shape: str):
+    for generator_day in parse_days(day):
+        if (generator_day, shape) not in GENERATORS:
+            continue
+        path = f"{str(generator_day).zfill(2)}/input_{shape + '_' if shape else ''}x{scale}.txt"
+        with open(path, "w") as f:
+            f.writelines(line + "\n" for line in generate(generator_day, scale, seed, shape))
+        print(f"Generated {path}")
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,184 @@
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from utils.runner import (
+    AllocationSite,
+    baseline_key,
+    format_bytes,
+    load_solver,
+    rejecting,
+    run_solver,
+    solver_entry,
+    solver_path,
+    trace_memory,
+)
+
+DEFAULT_BASELINE = "benchmark_baseline.json"
+# Median changes smaller than this are timer noise on sub-millisecond solvers, whatever the ratio
+MIN_REGRESSION_DELTA = 0.001
+IMPORT_MARKER = "--- solver imports ---"
+
+
+@dataclass
+class BenchmarkResult:
+    day: int
+    part: int
+    median: float
+    p95: float
+    peak_memory: int
+    repeats: int
+    scale: Optional[int] = None
+    import_time: Optional[float] = None
+    allocations: list[AllocationSite] = field(default_factory=list)
+    batch: bool = False
+    input_file: Optional[str] = None
+    shape: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return baseline_key(self.day, self.part, self.scale, self.shape, self.input_file, self.batch)
+
+    def __str__(self) -> str:
+        return (
+            f"Day {self.day:02} part {self.part}: median {self.median * 1000:.2f} ms"
+            f" | p95 {self.p95 * 1000:.2f} ms | peak memory {format_bytes(self.peak_memory)}"
+            + (f" | import {self.import_time * 1000:.2f} ms" if self.import_time is not None else "")
+        )
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline: float
+    current: float
+    metric: str = "median"
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+        if self.metric == "peak_memory":
+            change = f"{format_bytes(self.baseline)} -> {format_bytes(self.current)}"
+        else:
+            change = f"{self.baseline * 1000:.2f} ms -> {self.current * 1000:.2f} ms"
+        return f"{self.key} regressed: {self.metric} {change} ({(self.ratio - 1) * 100:+.1f}%)"
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def measure_memory(
+    day: int, part: int, input_lines: list[str], batch: bool = False, expect_error: bool = False
+) -> tuple[int, list[AllocationSite]]:
+    solve, solver_input = solver_entry(load_solver(day, part), input_lines, batch)
+    if expect_error:
+        solve = rejecting(solve)
+    _, peak, allocations = trace_memory(solve, solver_input)
+    return peak, allocations
+
+
+def measure_import_time(day: int, part: int) -> tuple[float, list[tuple[str, float]]]:
+    # Loads the solver in a fresh interpreter under -X importtime. Everything imported before the marker is
+    # interpreter startup, everything after it is what the solver pulls in
+    code = "\n".join(
+        [
+            "import importlib.util, sys",
+            f"spec = importlib.util.spec_from_file_location('solver', {solver_path(day, part)!r})",
+            "module = importlib.util.module_from_spec(spec)",
+            f"sys.stderr.write({IMPORT_MARKER!r} + '\\n')",
+            "spec.loader.exec_module(module)",
+        ]
+    )
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    ).stderr
+
+    modules = []
+    for line in output.split(IMPORT_MARKER, 1)[1].splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented, their time is already part of the top level import's cumulative time
+        if name.startswith("  "):
+            continue
+        modules.append((name.strip(), int(cumulative) / 1e6))
+    return sum(t for _, t in modules), sorted(modules, key=lambda m: m[1], reverse=True)
+
+
+def benchmark_solver(
+    day: int,
+    part: int,
+    input_lines: list[str],
+    repeats: int = 5,
+    warmup: int = 1,
+    scale: Optional[int] = None,
+    batch: bool = False,
+    input_file: Optional[str] = None,
+    shape: Optional[str] = None,
+    expect_error: bool = False,
+):
+    for _ in range(warmup):
+        run_solver(day, part, input_lines, batch=batch, expect_error=expect_error)
+
+    # Each run reloads the module, so module level caches don't leak between repeats
+    samples = [
+        run_solver(day, part, input_lines, batch=batch, expect_error=expect_error).wall_time for _ in range(repeats)
+    ]
+    peak_memory, allocations = measure_memory(day, part, input_lines, batch, expect_error)
+
+    return BenchmarkResult(
+        day,
+        part,
+        statistics.median(samples),
+        percentile(samples, 0.95),
+        peak_memory,
+        repeats,
+        scale,
+        measure_import_time(day, part)[0],
+        allocations,
+        batch,
+        input_file,
+        shape,
+    )
+
+
+def load_baseline(path: str) -> dict[str, dict]:
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: list[BenchmarkResult]):
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.key] = asdict(result)
+    with open(path, "w") as f:
+        json.dump(dict(sorted(baseline.items())), f, indent=4)
+
+
+def find_regressions(
+    result: BenchmarkResult,
+    baseline: dict[str, dict],
+    threshold: float,
+    memory_threshold: float,
+    min_delta: float = MIN_REGRESSION_DELTA,
+) -> list[Regression]:
+    if result.key not in baseline:
+        return []
+    regressions = []
+    for metric, allowed, floor in (("median", threshold, min_delta), ("peak_memory", memory_threshold, 0)):
+        expected = baseline[result.key].get(metric)
+        current = getattr(result, metric)
+        if expected and current > expected * (1 + allowed) and current - expected >= floor:
+            regressions.append(Regression(result.key, expected, current, metric))
+    return regressions
@@ -0,0 +1,117 @@
+import ast
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from typing import Iterable, Optional
+
+from utils.runner import RunResult, peak_rss, solver_key, solver_path
+
+DEFAULT_CACHE = ".cache/results.sqlite"
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+
+def local_module_path(name: str) -> Optional[str]:
+    base = name.replace(".", "/")
+    for path in (f"{base}.py", f"{base}/__init__.py"):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def local_imports(path: str) -> list[str]:
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+            # "from utils import grid" imports a module, "from utils.grid import Grid" doesn't, but checking is cheap
+            names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+
+    paths = []
+    for name in names:
+        # Parent packages run their __init__ first
+        parts = name.split(".")
+        for i in range(1, len(parts) + 1):
+            if (module_path := local_module_path(".".join(parts[:i]))) is not None:
+                paths.append(module_path)
+    return paths
+
+
+def solver_sources(day: int, part: int) -> list[str]:
+    # The solver and every module in this repository it imports, directly or indirectly
+    sources: list[str] = []
+    pending = [solver_path(day, part)]
+    while pending:
+        path = pending.pop()
+        if path in sources:
+            continue
+        sources.append(path)
+        pending.extend(local_imports(path))
+    return sorted(sources)
+
+
+def cache_key(day: int, part: int, input_lines: Iterable[str]) -> str:
+    digest = hashlib.sha256(solver_key(day, part).encode())
+    for path in solver_sources(day, part):
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+
+    input_digest = hashlib.sha256()
+    for line in input_lines:
+        input_digest.update(line.encode())
+        input_digest.update(b"\n")
+    digest.update(input_digest.digest())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    # Results keyed on cache_key, evicting the least recently used entries once the stored results outgrow max_size
+    def __init__(self, path: str = DEFAULT_CACHE, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, solver TEXT, value BLOB, size INTEGER, wall_time REAL, last_used REAL)"
+        )
+
+    def lookup(self, day: int, part: int, key: str) -> Optional[RunResult]:
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with self._db:
+            self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        result = pickle.loads(row[0])
+        cpu_time = time.process_time() - cpu_start
+        wall_time = time.perf_counter() - wall_start
+        return RunResult(day, part, result, wall_time, cpu_time, peak_rss(), cached=True, process_peak=True)
+
+    def store(self, key: str, result: RunResult):
+        value = pickle.dumps(result.result)
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (key, solver_key(result.day, result.part), value, len(value), result.wall_time, time.time()),
+            )
+            self._evict()
+
+    def _evict(self):
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+        if total <= self.max_size:
+            return
+        evicted = []
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY last_used"):
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM results WHERE key = ?", evicted)
@@ -0,0 +1,45 @@
+import importlib.util
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, Optional
+
+from utils.loader import map_file
+
+# Solver modules loaded by each worker process, keyed on path
+_modules: dict[str, ModuleType] = {}
+
+
+def chunk_ranges(path: str, count: int) -> list[tuple[int, int]]:
+    # Byte ranges of roughly equal size, every one ending just after a newline so no line is split
+    data = map_file(path)
+    size = len(data)
+    bounds = [0]
+    for i in range(1, count):
+        target = max(size * i // count, bounds[-1])
+        newline = data.find(b"\n", target)
+        bounds.append(size if newline < 0 else newline + 1)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def _run_chunk(module_path: str, name: str, path: str, start: int, end: int) -> Any:
+    # Solvers are loaded from their path rather than pickled by reference, they aren't importable by module name
+    if module_path not in _modules:
+        spec = importlib.util.spec_from_file_location(f"chunk_solver_{len(_modules)}", module_path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[module_path] = module
+    return getattr(_modules[module_path], name)(path, start, end)
+
+
+def map_chunks(module_path: str, name: str, path: str, jobs: Optional[int] = None) -> list[Any]:
+    # Calls name(path, start, end) from the module at module_path for every chunk of the file in worker processes.
+    # Only the byte range is sent to a worker, it reads the lines from its own mapping of the file
+    jobs = jobs or os.cpu_count() or 1
+    # A few chunks per worker, so one slow chunk doesn't leave the other workers idle at the end
+    ranges = chunk_ranges(path, jobs * 4)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_run_chunk, module_path, name, path, start, end) for start, end in ranges]
+        return [future.result() for future in futures]
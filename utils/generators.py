@@ -0,0 +1,582 @@
+import random
+from itertools import product
+from math import isqrt
+from typing import Callable, Optional
+
+Generator = Callable[[random.Random, int], list[str]]
+
+# Keyed on day and shape, None being the shape of the puzzle input
+GENERATORS: dict[tuple[int, Optional[str]], Generator] = {}
+
+LOWERCASE = "abcdefghijklmnopqrstuvwxyz"
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generator(day: int, shape: Optional[str] = None):
+    # Named shapes are inputs the puzzle input doesn't cover, e.g. the worst cases for a solver
+    def _register(fn: Generator) -> Generator:
+        GENERATORS[(day, shape)] = fn
+        return fn
+
+    return _register
+
+
+def generate(day: int, scale: int = 1, seed: int = 0, shape: Optional[str] = None) -> list[str]:
+    if (day, shape) not in GENERATORS:
+        raise Exception(f"No {shape + ' ' if shape else ''}generator for day {str(day).zfill(2)}")
+    if scale < 1:
+        raise Exception(f"Scale must be at least 1, got {scale}")
+    return GENERATORS[(day, shape)](random.Random(seed * 100 + day), scale)
+
+
+def names(alphabet: str, count: int, min_length: int = 2, exclude: frozenset[str] = frozenset()):
+    length = min_length
+    while len(alphabet) ** length < count + len(exclude):
+        length += 1
+    return ("".join(name) for name in product(alphabet, repeat=length) if "".join(name) not in exclude)
+
+
+def primes(start: int, end: int) -> list[int]:
+    return [n for n in range(max(start, 2), end) if all(n % d for d in range(2, isqrt(n) + 1))]
+
+
+@generator(1)
+def generate_01(rng: random.Random, scale: int) -> list[str]:
+    def _line():
+        parts = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                parts.append(str(rng.randint(1, 9)))
+            elif kind < 0.6:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append("".join(rng.choices(LOWERCASE, k=rng.randint(1, 6))))
+        rng.shuffle(parts)
+        return "".join(parts)
+
+    return [_line() for _ in range(1000 * scale)]
+
+
+@generator(1, "long")
+def generate_01_long(rng: random.Random, scale: int) -> list[str]:
+    # Lines of 10000 * scale characters with a digit word and a digit in the middle, the rest letters that spell no
+    # digit word, so finding the first and last digit means scanning half the line from either end
+    filler = "abcdjklmpqyz"
+    length = 10000 * scale
+
+    def _line():
+        middle = rng.choice(DIGIT_WORDS) + str(rng.randint(1, 9))
+        before = (length - len(middle)) // 2
+        after = length - before - len(middle)
+        return "".join(rng.choices(filler, k=before)) + middle + "".join(rng.choices(filler, k=after))
+
+    return [_line() for _ in range(10)]
+
+
+@generator(2)
+def generate_02(rng: random.Random, scale: int) -> list[str]:
+    def _grab():
+        colours = rng.sample(["red", "green", "blue"], k=rng.randint(1, 3))
+        return ", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours)
+
+    return [
+        f"Game {i + 1}: " + "; ".join(_grab() for _ in range(rng.randint(1, 6)))
+        for i in range(100 * scale)
+    ]
+
+
+@generator(2, "adversarial")
+def generate_02_adversarial(rng: random.Random, scale: int) -> list[str]:
+    # Games of thousands of grabs, then the record that made the old nested regex backtrack exponentially: valid
+    # pairs with no separators up to a stray character. Solvers reject it, see benchmark --expect-error
+    def _grab():
+        colours = rng.sample(["red", "green", "blue"], k=rng.randint(1, 3))
+        return ", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours)
+
+    games = [f"Game {i + 1}: " + "; ".join(_grab() for _ in range(1000 * scale)) for i in range(10)]
+    return games + [f"Game {len(games) + 1}: " + "1 red " * (1000 * scale) + "!"]
+
+
+@generator(3)
+def generate_03(rng: random.Random, scale: int) -> list[str]:
+    size = 140 * scale
+    grid = [["."] * size for _ in range(size)]
+
+    for y in range(size):
+        x = rng.randint(0, 3)
+        while x < size:
+            kind = rng.random()
+            if kind < 0.15:
+                number = str(rng.randint(1, 999))
+                for i, c in enumerate(number[: size - x]):
+                    grid[y][x + i] = c
+                x += len(number)
+            elif kind < 0.2 and 0 < y < size - 1 and 0 < x < size - 1:
+                grid[y][x] = rng.choice("*#+$/@=%&-*")
+                x += 1
+            x += rng.randint(1, 4)
+
+    return ["".join(row) for row in grid]
+
+
+@generator(4)
+def generate_04(rng: random.Random, scale: int) -> list[str]:
+    # Every card wins copies of the next ones, so with a match or more per card on average the copies of part 2
+    # grow exponentially along the input. Around 0.8 matches per card keeps them to a few copies of each card
+    match_weights = [0.45**k for k in range(11)]
+
+    def _card():
+        winning = rng.sample(range(1, 100), k=10)
+        (matches,) = rng.choices(range(11), match_weights)
+        others = rng.sample(sorted(set(range(1, 100)) - set(winning)), k=25 - matches)
+        picks = rng.sample(winning, k=matches) + others
+        rng.shuffle(picks)
+        return " ".join(f"{n:>2}" for n in winning) + " | " + " ".join(f"{n:>2}" for n in picks)
+
+    count = 200 * scale
+    width = len(str(count))
+    return [f"Card {i + 1:>{width}}: {_card()}" for i in range(count)]
+
+
+@generator(5)
+def generate_05(rng: random.Random, scale: int) -> list[str]:
+    max_value = 2**32
+    seeds = []
+    for _ in range(10 * scale):
+        start = rng.randrange(max_value // 2)
+        seeds.extend([start, rng.randint(1, max_value // (20 * scale))])
+
+    categories = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    lines = ["seeds: " + " ".join(map(str, seeds))]
+    for source, destination in zip(categories, categories[1:]):
+        breakpoints = sorted(rng.sample(range(1, max_value), k=40 * scale))
+        intervals = [(a, b - a) for a, b in zip([0, *breakpoints], [*breakpoints, max_value])]
+        # Shuffling the intervals into a contiguous destination space keeps the map a bijection
+        rng.shuffle(intervals)
+        dest = 0
+        rules = []
+        for start, length in intervals:
+            if rng.random() < 0.9:
+                rules.append(f"{dest} {start} {length}")
+            dest += length
+        lines.extend(["", f"{source}-to-{destination} map:", *rules])
+
+    return lines
+
+
+@generator(6)
+def generate_06(rng: random.Random, scale: int) -> list[str]:
+    times = [rng.randint(50, 99), *(rng.randint(10, 99) for _ in range(4 * scale - 1))]
+    # Records stay below t^2 / 4 and within three digits, so the concatenated race of part 2 is winnable too
+    dists = [rng.randint(min(t * t // 8, 999), min(t * t // 4 - 1, 999)) for t in times]
+    width = max(len(str(v)) for v in [*times, *dists]) + 1
+    return [
+        "Time:    " + "".join(f"{t:>{width}}" for t in times),
+        "Distance:" + "".join(f"{d:>{width}}" for d in dists),
+    ]
+
+
+@generator(7)
+def generate_07(rng: random.Random, scale: int) -> list[str]:
+    return [
+        f"{''.join(rng.choices('23456789TJQKA', k=5))} {rng.randint(1, 1000)}"
+        for _ in range(1000 * scale)
+    ]
+
+
+@generator(8)
+def generate_08(rng: random.Random, scale: int) -> list[str]:
+    directions = "".join(rng.choices("LR", k=rng.randint(15, 25) * scale))
+    cycle_lengths = rng.sample(primes(3, 40), k=6)
+    node_names = names("BCDEFGHIJKLMNOPQRSTUVWXY", (sum(cycle_lengths) + 1) * len(directions), min_length=3)
+
+    # Each ghost walks a cycle of prime * len(directions) nodes, so the Z node is hit at exact multiples of it
+    paths = []
+    for i, prime in enumerate(cycle_lengths):
+        # Start and end nodes are one character longer than the rest, so they can't collide with them
+        prefix = "AA" if i == 0 else next(node_names)
+        path = [f"{prefix}A"] + [next(node_names) for _ in range(prime * len(directions) - 1)]
+        paths.append([*path, f"{'ZZ' if i == 0 else prefix}Z"])
+
+    all_nodes = [node for path in paths for node in path]
+    lines = []
+    for path in paths:
+        loop = path[1:]
+        for i, node in enumerate(path):
+            next_node = loop[i % len(loop)]
+            decoy = rng.choice(all_nodes)
+            left, right = (next_node, decoy) if directions[i % len(directions)] == "L" else (decoy, next_node)
+            lines.append(f"{node} = ({left}, {right})")
+    rng.shuffle(lines)
+
+    return [directions, "", *lines]
+
+
+@generator(9)
+def generate_09(rng: random.Random, scale: int) -> list[str]:
+    def _line():
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(2, 8))]
+        return " ".join(str(sum(c * x**i for i, c in enumerate(coefficients))) for x in range(21))
+
+    return [_line() for _ in range(200 * scale)]
+
+
+def tree_loop(
+    rng: random.Random, width: int, height: int, fill: float, block: int = 4
+) -> dict[tuple[int, int], set[tuple[int, int]]]:
+    # Grow a random tree over part of a coarse grid and walk around its outline, scaled up so every coarse cell
+    # becomes a ring of block x block pipes. The outline of a tree is always a single simple loop.
+    start = (rng.randrange(width), rng.randrange(height))
+    cells = {start}
+    frontier = [(start, n) for n in [(0, 1), (1, 0), (0, -1), (-1, 0)]]
+    tree_edges = []
+    while frontier and len(cells) < width * height * fill:
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        cell, d = frontier.pop()
+        n = (cell[0] + d[0], cell[1] + d[1])
+        if n in cells or not (0 <= n[0] < width and 0 <= n[1] < height):
+            continue
+        cells.add(n)
+        tree_edges.append((cell, n) if d[0] + d[1] > 0 else (n, cell))
+        frontier.extend((n, nd) for nd in [(0, 1), (1, 0), (0, -1), (-1, 0)])
+
+    links: dict[tuple[int, int], set[tuple[int, int]]] = {}
+
+    def _link(a: tuple[int, int], b: tuple[int, int]):
+        links.setdefault(a, set()).add(b)
+        links.setdefault(b, set()).add(a)
+
+    def _unlink(a: tuple[int, int], b: tuple[int, int]):
+        links[a].discard(b)
+        links[b].discard(a)
+
+    last, low, high = block - 1, block // 2 - 1, block // 2
+    ring = [
+        *((i, 0) for i in range(last)),
+        *((last, i) for i in range(last)),
+        *((last - i, last) for i in range(last)),
+        *((0, last - i) for i in range(last)),
+    ]
+    for x, y in cells:
+        for (ax, ay), (bx, by) in zip(ring, [*ring[1:], ring[0]]):
+            _link((block * x + ax, block * y + ay), (block * x + bx, block * y + by))
+
+    for (x, y), (nx, ny) in tree_edges:
+        ox, oy, nox, noy = block * x, block * y, block * nx, block * ny
+        if nx > x:
+            _unlink((ox + last, oy + low), (ox + last, oy + high))
+            _unlink((nox, noy + low), (nox, noy + high))
+            _link((ox + last, oy + low), (nox, noy + low))
+            _link((ox + last, oy + high), (nox, noy + high))
+        else:
+            _unlink((ox + low, oy + last), (ox + high, oy + last))
+            _unlink((nox + low, noy), (nox + high, noy))
+            _link((ox + low, oy + last), (nox + low, noy))
+            _link((ox + high, oy + last), (nox + high, noy))
+
+    return links
+
+
+@generator(10)
+def generate_10(rng: random.Random, scale: int) -> list[str]:
+    size = 140 * scale
+    pipes = {
+        frozenset([(0, -1), (0, 1)]): "|",
+        frozenset([(-1, 0), (1, 0)]): "-",
+        frozenset([(0, -1), (1, 0)]): "L",
+        frozenset([(0, -1), (-1, 0)]): "J",
+        frozenset([(0, 1), (-1, 0)]): "7",
+        frozenset([(0, 1), (1, 0)]): "F",
+    }
+    grid = [rng.choices("|-LJ7F.", k=size) for _ in range(size)]
+    links = tree_loop(rng, size // 4, size // 4, 0.5)
+    for (x, y), linked in links.items():
+        grid[y][x] = pipes[frozenset((lx - x, ly - y) for lx, ly in linked)]
+
+    sx, sy = rng.choice(sorted(links))
+    grid[sy][sx] = "S"
+    # Only the two loop pipes may connect to the start
+    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        nx, ny = sx + dx, sy + dy
+        if 0 <= nx < size and 0 <= ny < size and (nx, ny) not in links:
+            grid[ny][nx] = "."
+
+    return ["".join(row) for row in grid]
+
+
+@generator(11)
+def generate_11(rng: random.Random, scale: int) -> list[str]:
+    size = 140 * scale
+    empty_rows = set(rng.sample(range(size), k=size // 20))
+    empty_cols = set(rng.sample(range(size), k=size // 20))
+    return [
+        "".join(
+            "#" if y not in empty_rows and x not in empty_cols and rng.random() < 0.02 else "."
+            for x in range(size)
+        )
+        for y in range(size)
+    ]
+
+
+@generator(12)
+def generate_12(rng: random.Random, scale: int) -> list[str]:
+    def _line():
+        springs = "".join(rng.choices(".#", k=rng.randint(5, 20)))
+        if "#" not in springs:
+            springs = springs[:-1] + "#"
+        counts = [len(group) for group in springs.split(".") if group]
+        pattern = "".join("?" if rng.random() < 0.5 else c for c in springs)
+        return f"{pattern} {','.join(map(str, counts))}"
+
+    return [_line() for _ in range(1000 * scale)]
+
+
+def reflection_mismatches(pattern: list[str]) -> list[int]:
+    return [
+        sum(sum(a != b for a, b in zip(top, bottom)) for top, bottom in zip(reversed(pattern[:i]), pattern[i:]))
+        for i in range(1, len(pattern))
+    ]
+
+
+@generator(13)
+def generate_13(rng: random.Random, scale: int) -> list[str]:
+    def _mirror(values: list, line: int) -> list:
+        for i in range(min(line, len(values) - line)):
+            values[line + i] = values[line - 1 - i]
+        return values
+
+    def _pattern():
+        # One perfect reflection between rows and one reflection between columns that is off by a single smudge
+        while True:
+            width, height = rng.randint(5, 17), rng.randint(5, 17)
+            row_line = rng.randint(1, height // 2 - 1) if height >= 4 else 1
+            col_line = rng.randint(1, width - 1)
+            rows = [_mirror(rng.choices(".#", k=width), col_line) for _ in range(height)]
+            rows = _mirror(rows, row_line)
+            x = rng.randrange(max(0, col_line - (width - col_line)), col_line)
+            y = rng.randrange(2 * row_line, height)
+            rows[y] = list(rows[y])
+            rows[y][x] = "." if rows[y][x] == "#" else "#"
+            pattern = ["".join(row) for row in rows]
+            mismatches = reflection_mismatches(pattern) + reflection_mismatches(["".join(c) for c in zip(*pattern)])
+            if mismatches.count(0) == 1 and mismatches.count(1) == 1:
+                return pattern if rng.random() < 0.5 else ["".join(c) for c in zip(*pattern)]
+
+    lines: list[str] = []
+    for i in range(100 * scale):
+        if i:
+            lines.append("")
+        lines.extend(_pattern())
+    return lines
+
+
+@generator(14)
+def generate_14(rng: random.Random, scale: int) -> list[str]:
+    size = 100 * scale
+    return ["".join(rng.choices("O#.", weights=[2, 1, 5], k=size)) for _ in range(size)]
+
+
+@generator(15)
+def generate_15(rng: random.Random, scale: int) -> list[str]:
+    labels = ["".join(rng.choices(LOWERCASE, k=rng.randint(2, 6))) for _ in range(500 * scale)]
+    steps = [
+        f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-"
+        for label in rng.choices(labels, k=4000 * scale)
+    ]
+    return [",".join(steps)]
+
+
+@generator(16)
+def generate_16(rng: random.Random, scale: int) -> list[str]:
+    size = 110 * scale
+    return ["".join(rng.choices(".|-/\\", weights=[40, 1, 1, 1, 1], k=size)) for _ in range(size)]
+
+
+@generator(17)
+def generate_17(rng: random.Random, scale: int) -> list[str]:
+    size = 141 * scale
+    return ["".join(rng.choices("123456789", k=size)) for _ in range(size)]
+
+
+def skyline(rng: random.Random, columns: int, max_height: int, max_width: int) -> list[tuple[str, int]]:
+    # A polygon made of columns hanging from y <= 0 down to y >= 3 is simple, starts at the origin as its top
+    # left corner and always has the cell below and to the right of the origin inside it.
+    def _profile(first: int, low: int, high: int):
+        step = max(1, (high - low) // 20)
+        values = [first]
+        while len(values) < columns:
+            if (v := min(high, max(low, values[-1] + rng.randint(-step, step)))) != values[-1]:
+                values.append(v)
+        return values
+
+    widths = [rng.randint(2, max_width), *(rng.randint(1, max_width) for _ in range(columns - 1))]
+    tops = _profile(0, -max_height, 0)
+    bottoms = _profile(rng.randint(3, 3 + max_height), 3, 3 + max_height)
+
+    def _vertical(a: int, b: int):
+        return ("D", b - a) if b > a else ("U", a - b)
+
+    steps = []
+    for i in range(columns):
+        steps.append(("R", widths[i]))
+        steps.append(_vertical(tops[i], tops[i + 1] if i + 1 < columns else bottoms[i]))
+    for i in reversed(range(columns)):
+        steps.append(("L", widths[i]))
+        steps.append(_vertical(bottoms[i], bottoms[i - 1] if i > 0 else tops[0]))
+    return steps
+
+
+@generator(18)
+def generate_18(rng: random.Random, scale: int) -> list[str]:
+    columns = 175 * scale
+    small = skyline(rng, columns, 10, 10)
+    large = skyline(rng, columns, 500_000, 500_000)
+    return [f"{d} {n} (#{m:05x}{'RDLU'.index(e)})" for (d, n), (e, m) in zip(small, large)]
+
+
+@generator(19)
+def generate_19(rng: random.Random, scale: int) -> list[str]:
+    count = 550 * scale
+    workflow_names = names(LOWERCASE, count, exclude=frozenset(["in"]))
+    pending = ["in"]
+    lines = []
+    created = 1
+    while pending:
+        name = pending.pop(0)
+        outcomes = []
+        for _ in range(rng.randint(2, 4)):
+            if created < count and rng.random() < 0.7:
+                child = next(workflow_names)
+                pending.append(child)
+                created += 1
+                outcomes.append(child)
+            else:
+                outcomes.append(rng.choice("AR"))
+        steps = [f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(2, 3999)}:{o}" for o in outcomes[:-1]]
+        lines.append(f"{name}{{{','.join([*steps, outcomes[-1]])}}}")
+    rng.shuffle(lines)
+
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+        for _ in range(200 * scale)
+    ]
+    return [*lines, "", *parts]
+
+
+@generator(20)
+def generate_20(rng: random.Random, scale: int) -> list[str]:
+    chains = 4 * scale
+    bits = 12
+    while len(candidates := primes(2 ** (bits - 1), 2**bits)) < chains:
+        bits += 1
+    periods = rng.sample(candidates, k=chains)
+    module_names = names(LOWERCASE, chains * (bits + 2) + 1, exclude=frozenset(["rx"]))
+
+    final = next(module_names)
+    lines = [f"&{final} -> rx"]
+    starts = []
+    for period in periods:
+        # Twelve flip-flops form a binary counter, the conjunction resets it once it reaches the period
+        flip_flops = [next(module_names) for _ in range(bits)]
+        hub, inverter = next(module_names), next(module_names)
+        hub_targets = [flip_flops[0]]
+        for i, flip_flop in enumerate(flip_flops):
+            targets = [flip_flops[i + 1]] if i + 1 < bits else []
+            if period >> i & 1:
+                targets.append(hub)
+            elif i > 0:
+                hub_targets.append(flip_flop)
+            lines.append(f"%{flip_flop} -> {', '.join(targets)}")
+        lines.append(f"&{hub} -> {', '.join([*hub_targets, inverter])}")
+        lines.append(f"&{inverter} -> {final}")
+        starts.append(flip_flops[0])
+    lines.append(f"broadcaster -> {', '.join(starts)}")
+    rng.shuffle(lines)
+    return lines
+
+
+@generator(21)
+def generate_21(rng: random.Random, scale: int) -> list[str]:
+    size = 131 * scale + (scale + 1) % 2
+    middle = size // 2
+    grid = [
+        [
+            "." if x in (0, middle, size - 1) or y in (0, middle, size - 1) or rng.random() > 0.15 else "#"
+            for x in range(size)
+        ]
+        for y in range(size)
+    ]
+    grid[middle][middle] = "S"
+    return ["".join(row) for row in grid]
+
+
+@generator(22)
+def generate_22(rng: random.Random, scale: int) -> list[str]:
+    occupied: set[tuple[int, int, int]] = set()
+    lines = []
+    while len(lines) < 1200 * scale:
+        axis = rng.randrange(3)
+        length = rng.randint(0, 4 if axis < 2 else 3)
+        start = [rng.randrange(10), rng.randrange(10), rng.randint(1, 300 * scale)]
+        end = list(start)
+        end[axis] += length
+        if end[0] >= 10 or end[1] >= 10:
+            continue
+        cubes = {
+            (x, y, z)
+            for x in range(start[0], end[0] + 1)
+            for y in range(start[1], end[1] + 1)
+            for z in range(start[2], end[2] + 1)
+        }
+        if cubes & occupied:
+            continue
+        occupied |= cubes
+        lines.append(f"{','.join(map(str, start))}~{','.join(map(str, end))}")
+    return lines
+
+
+@generator(23)
+def generate_23(rng: random.Random, scale: int) -> list[str]:
+    # Straight corridors on a lattice give the grid of junctions the real puzzle has, all slopes lead right or down
+    size = 141 * scale
+
+    def _lines():
+        values = [1]
+        while values[-1] + 20 < size - 2:
+            values.append(values[-1] + rng.randint(20, 30))
+        values[-1] = size - 2
+        return values
+
+    xs, ys = _lines(), _lines()
+    grid = [["#"] * size for _ in range(size)]
+    for y in ys:
+        for x in range(1, size - 1):
+            grid[y][x] = "."
+    for x in xs:
+        for y in range(1, size - 1):
+            grid[y][x] = "."
+    for x in xs:
+        for y in ys:
+            for dx, dy, slope in [(-1, 0, ">"), (1, 0, ">"), (0, -1, "v"), (0, 1, "v")]:
+                if 1 <= x + dx < size - 1 and 1 <= y + dy < size - 1 and grid[y + dy][x + dx] == ".":
+                    if x + dx not in xs or y + dy not in ys:
+                        grid[y + dy][x + dx] = slope
+    grid[0][1] = "."
+    grid[size - 1][size - 2] = "."
+    return ["".join(row) for row in grid]
+
+
+@generator(24)
+def generate_24(rng: random.Random, scale: int) -> list[str]:
+    rock = [rng.randint(200_000_000_000_000, 300_000_000_000_000) for _ in range(3)]
+    rock_velocity = [rng.randint(-200, 200) for _ in range(3)]
+    times = rng.sample(range(10_000_000_000, 1_000_000_000_000), k=300 * scale)
+    lines = []
+    for t in times:
+        while (velocity := [rng.randint(-300, 300) for _ in range(3)]) == rock_velocity or 0 in velocity:
+            pass
+        position = [r + (rv - v) * t for r, rv, v in zip(rock, rock_velocity, velocity)]
+        lines.append(f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}")
+    return lines
@@ -0,0 +1,149 @@
+from functools import cached_property
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Cells are stored row by row in one flat uint8 array, surrounded by a one cell border of PADDING.
+# Stepping off the grid lands on the border instead of wrapping around, so flat index arithmetic needs no bounds
+# checks: index + grid.offsets[d] is always a valid index for any cell inside the grid.
+PADDING = 0
+
+NORTH, EAST, SOUTH, WEST = range(4)
+STEPS: tuple[tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+# All eight neighbours, diagonals included
+AROUND: tuple[tuple[int, int], ...] = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
+
+
+class Grid:
+    def __init__(self, cells: np.ndarray):
+        self.height, self.width = cells.shape
+        self.stride = self.width + 2
+        padded = np.full((self.height + 2, self.stride), PADDING, dtype=np.uint8)
+        padded[1:-1, 1:-1] = cells
+        self.flat = padded.ravel()
+        self.offsets = tuple(self.offset(step) for step in STEPS)
+        self.around = tuple(self.offset(step) for step in AROUND)
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "Grid":
+        width = len(lines[0])
+        assert all(len(line) == width for line in lines)
+        cells = np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), width)
+        return cls(cells)
+
+    @property
+    def cells(self) -> np.ndarray:
+        return self.flat.reshape(self.height + 2, self.stride)[1:-1, 1:-1]
+
+    def offset(self, step: tuple[int, int]) -> int:
+        return step[1] * self.stride + step[0]
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def point(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def find(self, c: str) -> int:
+        return int(np.flatnonzero(self.flat == ord(c))[0])
+
+    @cached_property
+    def in_bounds(self) -> np.ndarray:
+        return self.flat != PADDING
+
+    @cached_property
+    def neighbours(self) -> np.ndarray:
+        # neighbours[i, d] is the index one step from i in direction d, or -1 when that step leaves the grid
+        indices = np.arange(self.flat.size, dtype=np.int32)
+        table = np.full((self.flat.size, len(STEPS)), -1, dtype=np.int32)
+        inner = indices[self.in_bounds]
+        for d, offset in enumerate(self.offsets):
+            targets = inner + offset
+            table[inner, d] = np.where(self.in_bounds[targets], targets, -1)
+        return table
+
+    def mask(self, chars: str) -> np.ndarray:
+        table = np.zeros(256, dtype=bool)
+        table[[ord(c) for c in chars]] = True
+        return table[self.flat]
+
+    def lookup(self, values: dict[str, int], default: int = 0, dtype=np.int32) -> np.ndarray:
+        table = np.full(256, default, dtype=dtype)
+        for c, value in values.items():
+            table[ord(c)] = value
+        return table[self.flat]
+
+    def dilate(self, mask: np.ndarray) -> np.ndarray:
+        # Grows mask by one cell in all eight directions. Cells on the border must be False, then nothing spills over
+        # from one row into the next
+        grown = mask.copy()
+        for offset in self.around:
+            if offset > 0:
+                grown[:-offset] |= mask[offset:]
+            else:
+                grown[-offset:] |= mask[:offset]
+        return grown
+
+    def label_runs(self, mask: np.ndarray) -> tuple[np.ndarray, int]:
+        # Numbers each horizontal run of True cells 1, 2, ... in reading order, 0 outside the runs. The border
+        # columns end every run at the end of its row
+        starts = mask.copy()
+        starts[1:] &= ~mask[:-1]
+        labels = np.cumsum(starts, dtype=np.int32)
+        labels[~mask] = 0
+        return labels, int(starts.sum())
+
+    def numbers(self) -> tuple[np.ndarray, np.ndarray]:
+        # Labels the runs of digits and reads their values: values[labels[i]] is the number covering cell i and
+        # values[0] is 0. The digits are weighted in float64, exact for numbers below 2**53
+        digits = self.flat - ord("0")
+        is_digit = digits < 10
+        labels, count = self.label_runs(is_digit)
+        positions = np.flatnonzero(is_digit)
+        run_labels = labels[positions]
+        last = positions[np.diff(run_labels, append=0) != 0]
+        place = last[run_labels - 1] - positions
+        weights = digits[positions] * np.power(10.0, place)
+        values = np.rint(np.bincount(run_labels, weights, minlength=count + 1)).astype(np.int64)
+        return labels, values
+
+    def distances(self, sources: Iterable[int], passable: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+        # Breadth first search from all sources at once, one vectorised step per distance. Unreached cells are -1
+        distance = np.full(self.flat.size, -1, dtype=np.int32)
+        frontier = np.fromiter(sources, dtype=np.int32)
+        frontier = np.unique(frontier[passable[frontier]])
+        distance[frontier] = 0
+        depth = 0
+        while frontier.size and (limit is None or depth < limit):
+            depth += 1
+            candidates = self.neighbours[frontier].ravel()
+            candidates = candidates[candidates >= 0]
+            frontier = np.unique(candidates[passable[candidates] & (distance[candidates] < 0)])
+            distance[frontier] = depth
+        return distance
+
+
+class NumberIndex:
+    # Maps every cell to the id of the number written across it, 0 for cells outside any number, with values[id]
+    # holding the number itself. The border keeps lookups around any cell in bounds
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.ids, self.values = grid.numbers()
+
+    def adjacent(self, cells: np.ndarray) -> np.ndarray:
+        # Row k lists the distinct numbers next to cells[k] as ids, padded with 0 and in no particular order
+        ids = self.ids[np.asarray(cells)[:, None] + np.array(self.grid.around)]
+        ids.sort(axis=1)
+        # A number spanning several neighbours shows up in consecutive slots once sorted
+        ids[:, 1:][ids[:, 1:] == ids[:, :-1]] = 0
+        return ids
+
+    def counts(self, ids: np.ndarray) -> np.ndarray:
+        return np.count_nonzero(ids, axis=1)
+
+    def products(self, ids: np.ndarray) -> np.ndarray:
+        return np.where(ids != 0, self.values[ids], 1).prod(axis=1)
@@ -0,0 +1,65 @@
+import mmap
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def map_file(path: str) -> Union[mmap.mmap, bytes]:
+    with open(path, "rb") as f:
+        try:
+            # The mapping stays valid after the file is closed
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped
+            return b""
+
+
+def iter_lines(data: Union[mmap.mmap, bytes], start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    # Only the current line is copied out of the mapping, so memory use doesn't grow with the file size
+    if end is None:
+        end = len(data)
+    while start < end:
+        newline = data.find(b"\n", start, end)
+        if newline < 0:
+            newline = end
+        yield data[start:newline].strip()
+        start = newline + 1
+
+
+def text_lines(path: str) -> Iterator[str]:
+    data = map_file(path)
+    for line in iter_lines(data):
+        yield line.decode()
+
+
+class MappedLines:
+    # Re-readable, picklable stand-in for a list of input lines that streams them from disk on every iteration
+    def __init__(self, path: str):
+        self.path = path
+
+    def __iter__(self) -> Iterator[str]:
+        return text_lines(self.path)
+
+    def buffer(self) -> Union[mmap.mmap, bytes]:
+        return map_file(self.path)
+
+
+def grid_view(data: Union[mmap.mmap, bytes]) -> "np.ndarray":
+    # (height, width) uint8 view straight onto the file contents, line endings are skipped with the row stride.
+    # numpy is imported here, line based days use this module too and shouldn't pay for it
+    import numpy as np
+
+    end = len(data)
+    while end and data[end - 1 : end] in (b"\n", b"\r"):
+        end -= 1
+
+    width = data.find(b"\n", 0, end)
+    if width < 0:
+        return np.frombuffer(data, dtype=np.uint8, count=end).reshape(1 if end else 0, end)
+
+    stride = width + 1
+    if width and data[width - 1 : width] == b"\r":
+        width -= 1
+    height = (end - width) // stride + 1
+
+    return np.ndarray((height, width), dtype=np.uint8, buffer=data, strides=(stride, 1))
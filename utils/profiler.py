@@ -0,0 +1,129 @@
+import cProfile
+import linecache
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType, FrameType
+from typing import Any, Callable, Optional
+
+DEFAULT_INTERVAL = 0.001
+
+
+@dataclass
+class FunctionStats:
+    name: str
+    location: str
+    calls: int
+    self_time: float
+    cumulative_time: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.self_time * 1000:>10.2f} {self.cumulative_time * 1000:>10.2f} {self.calls:>10}"
+            f"  {self.name} ({self.location})"
+        )
+
+
+@dataclass
+class LineStats:
+    location: str
+    samples: int
+    share: float
+    source: str
+
+    def __str__(self) -> str:
+        return f"{self.samples:>8} {self.share * 100:>6.1f}%  {self.location}  {self.source}"
+
+
+def relative_path(path: str) -> str:
+    # Paths outside the repository (standard library, site-packages) are kept absolute
+    relative = os.path.relpath(path)
+    return path if relative.startswith("..") else relative
+
+
+def frame_label(code: CodeType) -> str:
+    return f"{code.co_name} ({relative_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+def profile_functions(fn: Callable, *args) -> tuple[Any, list[FunctionStats]]:
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args)
+
+    stats = []
+    for (filename, line, name), (_, calls, self_time, cumulative_time, _) in pstats.Stats(profiler).stats.items():
+        location = relative_path(filename) + (f":{line}" if line else "")
+        stats.append(FunctionStats(name, location, calls, self_time, cumulative_time))
+    return result, sorted(stats, key=lambda s: s.self_time, reverse=True)
+
+
+class Sampler:
+    # Samples the stack of the profiled call from a background thread. The interval is a lower bound, the sampling
+    # thread has to wait for the GIL like any other thread
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.lines: Counter[tuple[str, int]] = Counter()
+        self._stop = threading.Event()
+        self._target = 0
+        self._root: Optional[FrameType] = None
+        self._entry: Optional[CodeType] = None
+
+    def run(self, fn: Callable, *args) -> Any:
+        self._target = threading.get_ident()
+        # Frames from here outwards belong to the profiler and the CLI, not the solver
+        self._root = sys._getframe()
+        self._entry = fn.__code__
+        # The solver only hands over the GIL every switch interval, which would cap the sampling rate
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.interval))
+        thread = threading.Thread(target=self._sample, daemon=True)
+        thread.start()
+        try:
+            return fn(*args)
+        finally:
+            self._stop.set()
+            thread.join()
+            sys.setswitchinterval(switch_interval)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            line = (frame.f_code.co_filename, frame.f_lineno)
+
+            stack = []
+            while frame is not None and frame.f_back is not self._root:
+                stack.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            if frame is None or frame.f_code is not self._entry:
+                # Sampled before entering or after leaving the profiled call
+                continue
+            stack.append(frame_label(frame.f_code))
+            self.lines[line] += 1
+            self.stacks[tuple(reversed(stack))] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.lines.values())
+
+    def hot_lines(self) -> list[LineStats]:
+        total = self.total
+        return [
+            LineStats(
+                f"{relative_path(filename)}:{line}",
+                samples,
+                samples / total,
+                linecache.getline(filename, line).strip(),
+            )
+            for (filename, line), samples in self.lines.most_common()
+        ]
+
+    def write_collapsed(self, path: str):
+        # One "outer;inner;innermost count" line per distinct stack, as read by flamegraph.pl, speedscope and inferno
+        with open(path, "w") as f:
+            for stack, samples in sorted(self.stacks.items()):
+                f.write(f"{';'.join(stack)} {samples}\n")
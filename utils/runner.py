@@ -0,0 +1,299 @@
+import importlib.util
+import linecache
+import math
+import os
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from utils.loader import MappedLines, text_lines
+from utils.profiler import relative_path
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore
+
+ALL_DAYS = list(range(1, 26))
+ALL_PARTS = [1, 2]
+# Days whose solvers only walk the input once, front to back, and accept any iterable of lines
+STREAMING_DAYS = [1, 2, 4, 6, 7, 9, 15, 24]
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+    source: str
+
+    def __str__(self) -> str:
+        return f"{format_bytes(self.size):>10} {self.count:>9} blocks  {self.location}  {self.source}"
+
+
+@dataclass
+class RunResult:
+    day: int
+    part: int
+    result: Any
+    wall_time: float
+    cpu_time: float
+    peak_rss: Optional[int]
+    cached: bool = False
+    traced_peak: Optional[int] = None
+    allocations: list[AllocationSite] = field(default_factory=list)
+    # Whether peak_rss covers the whole process so far rather than just this run
+    process_peak: bool = False
+
+    def __str__(self) -> str:
+        rss = format_bytes(self.peak_rss) if self.peak_rss is not None else "n/a"
+        rss_label = "process peak rss" if self.process_peak else "peak rss"
+        return (
+            f"Day {self.day:02} part {self.part}: {self.result}"
+            f" | wall {self.wall_time * 1000:.2f} ms | cpu {self.cpu_time * 1000:.2f} ms | {rss_label} {rss}"
+            + (f" | traced peak {format_bytes(self.traced_peak)}" if self.traced_peak is not None else "")
+            + (" | cached" if self.cached else "")
+        )
+
+
+def format_bytes(size: float) -> str:
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def parse_days(spec: str) -> list[int]:
+    days: list[int] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = map(int, part.split("-"))
+            days.extend(range(start, end + 1))
+        else:
+            days.append(int(part))
+    if any(day not in ALL_DAYS for day in days):
+        raise Exception(f"Invalid day specification: {spec}")
+    return sorted(set(days))
+
+
+def solver_key(day: int, part: int, scale: Optional[int] = None) -> str:
+    return f"{day:02}/{part}" + (f"@x{scale}" if scale else "")
+
+
+def baseline_key(
+    day: int,
+    part: int,
+    scale: Optional[int] = None,
+    shape: Optional[str] = None,
+    input_file: Optional[str] = None,
+    batch: bool = False,
+) -> str:
+    # Batch mode runs different code than line mode and other inputs do different work, so each gets its own
+    # baseline, e.g. 02/1@x4:adversarial or 04/1<big.txt+batch
+    key = solver_key(day, part, scale)
+    if shape is not None:
+        key += f":{shape}"
+    if input_file is not None:
+        key += f"<{os.path.normpath(input_file)}"
+    return key + ("+batch" if batch else "")
+
+
+def solver_path(day: int, part: int) -> str:
+    return f"{str(day).zfill(2)}/{part}/main.py"
+
+
+def input_path(day: int) -> str:
+    return f"{str(day).zfill(2)}/input.txt"
+
+
+def load_solver(day: int, part: int) -> ModuleType:
+    path = solver_path(day, part)
+    if not os.path.isfile(path):
+        raise Exception(f"Solver {path} doesn't exist")
+
+    spec = importlib.util.spec_from_file_location(f"day_{str(day).zfill(2)}_{part}", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_input(path: str) -> list[str]:
+    return list(text_lines(path))
+
+
+def reset_peak_rss() -> bool:
+    # Linux lets a process reset its own peak RSS, so that peak_rss afterwards only covers what ran since
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss() -> Optional[int]:
+    # VmHWM starts over with reset_peak_rss, ru_maxrss is the peak of the whole process. Both are in kilobytes
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def allocation_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[AllocationSite]:
+    # Leave out the watcher thread's own allocations
+    ignored = [tracemalloc.__file__, threading.__file__, __file__]
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, path) for path in ignored])
+    sites = []
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        location = f"{relative_path(frame.filename)}:{frame.lineno}"
+        source = linecache.getline(frame.filename, frame.lineno).strip()
+        sites.append(AllocationSite(location, stat.size, stat.count, source))
+    return sites
+
+
+def trace_memory(
+    fn: Callable, *args, top: int = 5, interval: float = 0.01
+) -> tuple[Any, int, list[AllocationSite]]:
+    # tracemalloc only knows about live blocks, a snapshot after fn returns would miss everything freed on the way out.
+    # Instead a background thread snapshots whenever the traced size reaches a new high, so the sites reported are the
+    # ones holding memory close to the peak
+    snapshot: Optional[tracemalloc.Snapshot] = None
+    snapshot_size = 0
+    stop = threading.Event()
+
+    def watch():
+        nonlocal snapshot, snapshot_size
+        while not stop.wait(interval):
+            current, _ = tracemalloc.get_traced_memory()
+            # Only re-snapshot on real growth, a snapshot costs time proportional to the number of live blocks
+            if current > snapshot_size * 1.1:
+                snapshot, snapshot_size = tracemalloc.take_snapshot(), current
+
+    tracemalloc.start()
+    thread = threading.Thread(target=watch, daemon=True)
+    thread.start()
+    try:
+        result = fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        stop.set()
+        thread.join()
+        if snapshot is None:
+            snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    return result, peak, allocation_sites(snapshot, top)
+
+
+def solver_entry(
+    module: ModuleType, input_lines: Iterable[str], batch: bool = False, workers: int = 0
+) -> tuple[Callable, Any]:
+    # Solvers can offer solve_file, splitting an input file between worker processes itself
+    if workers and hasattr(module, "solve_file") and isinstance(input_lines, MappedLines):
+        return partial(module.solve_file, jobs=workers), input_lines.path
+    # and solve_buffer, taking the whole input as bytes instead of lines
+    if batch and hasattr(module, "solve_buffer"):
+        if isinstance(input_lines, MappedLines):
+            return module.solve_buffer, input_lines.buffer()
+        return module.solve_buffer, "".join(line + "\n" for line in input_lines).encode()
+    # Lists are copied in case the solver modifies them, streamed inputs are read afresh on every iteration anyway
+    if isinstance(input_lines, list):
+        return module.solve, list(input_lines)
+    # and go to solve_stream if there is one, a variant that doesn't hold on to the input
+    return getattr(module, "solve_stream", module.solve), input_lines
+
+
+def rejecting(solve: Callable) -> Callable:
+    # For inputs made to be rejected: the ValueError becomes the result, so the time it takes can be measured
+    def _solve(solver_input):
+        try:
+            return solve(solver_input)
+        except ValueError as e:
+            return e
+
+    return _solve
+
+
+def run_solver(
+    day: int,
+    part: int,
+    input_lines: Iterable[str],
+    memory: bool = False,
+    batch: bool = False,
+    workers: int = 0,
+    expect_error: bool = False,
+) -> RunResult:
+    module = load_solver(day, part)
+    solve, solver_input = solver_entry(module, input_lines, batch, workers)
+    if expect_error:
+        solve = rejecting(solve)
+    isolated = reset_peak_rss()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if memory:
+        result, traced_peak, allocations = trace_memory(solve, solver_input)
+    else:
+        result, traced_peak, allocations = solve(solver_input), None, []
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    return RunResult(
+        day, part, result, wall_time, cpu_time, peak_rss(), False, traced_peak, allocations, process_peak=not isolated
+    )
+
+
+def available_solvers(days: list[int], parts: list[int]) -> list[tuple[int, int]]:
+    return [(day, part) for day in days for part in parts if os.path.isfile(solver_path(day, part))]
+
+
+def longest_first(
+    tasks: list[tuple[int, int, Iterable[str]]],
+    expected: dict[str, float],
+    scale: Optional[int] = None,
+    shape: Optional[str] = None,
+    input_file: Optional[str] = None,
+    batch: bool = False,
+) -> list[tuple[int, int, Iterable[str]]]:
+    # Solvers without a recorded time are scheduled first, they might be the slow ones
+    def _expected(task: tuple[int, int, Iterable[str]]) -> float:
+        return expected.get(baseline_key(task[0], task[1], scale, shape, input_file, batch), math.inf)
+
+    return sorted(tasks, key=lambda task: -_expected(task))
+
+
+def run_parallel(
+    tasks: list[tuple[int, int, Iterable[str]]],
+    jobs: Optional[int] = None,
+    memory: bool = False,
+    batch: bool = False,
+    workers: int = 0,
+) -> Iterator[tuple[int, int, Union[RunResult, BaseException]]]:
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(run_solver, day, part, input_lines, memory, batch, workers): (day, part)
+            for day, part, input_lines in tasks
+        }
+        for future in as_completed(futures):
+            day, part = futures[future]
+            try:
+                yield day, part, future.result()
+            except Exception as e:
+                yield day, part, e
@@ -0,0 +1,61 @@
+from utils.benchmark import BenchmarkResult, find_regressions, percentile
+from utils.runner import longest_first
+
+
+def result(median: float, peak_memory: int = 1000, **kwargs) -> BenchmarkResult:
+    return BenchmarkResult(4, 1, median, median, peak_memory, 5, **kwargs)
+
+
+def test_percentile():
+    samples = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(samples, 0.5) == 3.0
+    assert percentile(samples, 0.95) == 5.0
+    assert percentile(samples, 0.2) == 1.0
+    assert percentile(samples, 0.0) == 1.0
+    assert percentile([7.0], 0.95) == 7.0
+
+
+def test_key():
+    assert result(1.0).key == "04/1"
+    assert result(1.0, scale=5000, batch=True).key == "04/1@x5000+batch"
+    assert result(1.0, input_file="./04/big.txt").key == "04/1<04/big.txt"
+    assert result(1.0, input_file="04/big.txt").key != result(1.0).key
+
+
+def test_regressions():
+    baseline = {"04/1": {"median": 0.010, "peak_memory": 1000}}
+    assert find_regressions(result(0.011), baseline, 0.2, 0.1) == []
+
+    (regression,) = find_regressions(result(0.015), baseline, 0.2, 0.1)
+    assert (regression.key, regression.metric) == ("04/1", "median")
+    assert (regression.baseline, regression.current) == (0.010, 0.015)
+
+    (regression,) = find_regressions(result(0.010, peak_memory=1200), baseline, 0.2, 0.1)
+    assert regression.metric == "peak_memory"
+
+
+def test_regressions_below_min_delta():
+    # Doubling a sub-millisecond median is noise, not a regression
+    baseline = {"04/1@x1": {"median": 0.00009, "peak_memory": 1000}}
+    assert find_regressions(result(0.00017, scale=1), baseline, 0.2, 0.1) == []
+    assert len(find_regressions(result(0.00017, scale=1), baseline, 0.2, 0.1, min_delta=0)) == 1
+
+
+def test_regressions_only_against_same_key():
+    baseline = {"04/1": {"median": 0.010, "peak_memory": 1000}}
+    assert find_regressions(result(1.0, batch=True), baseline, 0.2, 0.1) == []
+    assert find_regressions(result(1.0, input_file="other.txt"), baseline, 0.2, 0.1) == []
+
+
+def test_scheduling_uses_benchmark_keys():
+    # Part 1 is the slower one in line mode, part 2 with --batch or on big.txt
+    medians = [(1, 0.5, {}), (2, 0.2, {}), (1, 0.1, {"batch": True}), (2, 0.3, {"batch": True})]
+    medians += [(1, 0.1, {"input_file": "big.txt"}), (2, 0.3, {"input_file": "big.txt"})]
+    baseline = {BenchmarkResult(4, part, median, median, 1000, 5, **mode).key: median for part, median, mode in medians}
+
+    tasks = [(4, 1, []), (4, 2, [])]
+    assert [task[1] for task in longest_first(tasks, baseline)] == [1, 2]
+    assert [task[1] for task in longest_first(tasks, baseline, batch=True)] == [2, 1]
+    assert [task[1] for task in longest_first(tasks, baseline, input_file="big.txt")] == [2, 1]
+    # Unknown solvers go first
+    assert [task[1] for task in longest_first(tasks, {"04/2": 0.1})] == [1, 2]
@@ -0,0 +1,65 @@
+import os
+import shutil
+
+import pytest
+
+from utils.cache import ResultCache, cache_key, solver_sources
+from utils.runner import RunResult
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_result(day: int, part: int, result) -> RunResult:
+    return RunResult(day, part, result, 0.5, 0.5, None)
+
+
+def test_store_and_lookup(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite"))
+    assert cache.lookup(1, 1, "key") is None
+    cache.store("key", run_result(1, 1, 142))
+    cached = cache.lookup(1, 1, "key")
+    assert (cached.result, cached.cached) == (142, True)
+
+
+def test_eviction(tmp_path):
+    # Each result pickles to a few hundred bytes, so only two fit
+    cache = ResultCache(str(tmp_path / "results.sqlite"), max_size=600)
+    for key in "abc":
+        cache.store(key, run_result(1, 1, key * 250))
+    assert cache.lookup(1, 1, "a") is None
+    assert cache.lookup(1, 1, "c") is not None
+    assert cache.lookup(1, 1, "b") is not None
+
+    # Looking up "b" last made "c" the least recently used
+    cache.store("d", run_result(1, 1, "d" * 250))
+    assert cache.lookup(1, 1, "b") is not None
+    assert cache.lookup(1, 1, "c") is None
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    # cache_key hashes solver sources relative to the working directory, so work on a copy
+    monkeypatch.chdir(ROOT)
+    paths = solver_sources(1, 1) + solver_sources(1, 2)
+    for path in paths:
+        os.makedirs(tmp_path / os.path.dirname(path), exist_ok=True)
+        shutil.copy(os.path.join(ROOT, path), tmp_path / path)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_key_invalidation(repo):
+    key = cache_key(1, 1, ["1abc2"])
+    assert cache_key(1, 1, ["1abc2"]) == key
+    assert cache_key(1, 1, ["1abc3"]) != key
+    assert cache_key(1, 2, ["1abc2"]) != key
+
+    with open(repo / "01/1/main.py", "a") as f:
+        f.write("\n# changed\n")
+    changed = cache_key(1, 1, ["1abc2"])
+    assert changed != key
+
+    # Helpers the solver imports count as part of the solver
+    with open(repo / "utils/loader.py", "a") as f:
+        f.write("\n# changed\n")
+    assert cache_key(1, 1, ["1abc2"]) != changed
@@ -0,0 +1,70 @@
+import numpy as np
+
+from utils.grid import Grid, NumberIndex
+
+
+def cells(grid: Grid, mask: np.ndarray) -> set[tuple[int, int]]:
+    return {grid.point(int(i)) for i in np.flatnonzero(mask)}
+
+
+def test_dilate():
+    grid = Grid.from_lines(["....", "...#", "....", "#..."])
+    grown = grid.dilate(grid.mask("#"))
+    # Cells on the edge grow into the border but not into the opposite end of the next or previous row
+    assert cells(grid, grown & grid.in_bounds) == {
+        (2, 0), (3, 0), (2, 1), (3, 1), (2, 2), (3, 2), (0, 2), (1, 2), (0, 3), (1, 3)
+    }
+
+
+def test_label_runs():
+    grid = Grid.from_lines(["..12", "34.."])
+    labels, count = grid.label_runs(grid.mask("0123456789"))
+    assert count == 2
+    # 12 ends its row right before 34 starts the next, the border keeps them apart
+    assert labels[grid.index(2, 0)] == labels[grid.index(3, 0)] == 1
+    assert labels[grid.index(0, 1)] == labels[grid.index(1, 1)] == 2
+    assert labels[grid.index(0, 0)] == labels[grid.index(3, 1)] == 0
+
+
+def test_numbers():
+    grid = Grid.from_lines(["467.", "..35", "7...", ".901"])
+    labels, values = grid.numbers()
+    assert values.tolist() == [0, 467, 35, 7, 901]
+    assert values[labels[grid.index(1, 0)]] == 467
+    assert values[labels[grid.index(3, 3)]] == 901
+    assert labels[grid.index(3, 0)] == 0
+
+
+def test_adjacent_three_numbers():
+    grid = Grid.from_lines(["1.2", ".*.", "..3"])
+    index = NumberIndex(grid)
+    ids = index.adjacent([grid.index(1, 1)])
+    assert index.counts(ids).tolist() == [3]
+    assert index.products(ids).tolist() == [6]
+
+
+def test_adjacent_number_through_several_digits():
+    grid = Grid.from_lines(["123", ".*.", "45."])
+    index = NumberIndex(grid)
+    ids = index.adjacent([grid.index(1, 1)])
+    # 123 touches the star through all three digits and 45 through two, each counts once
+    assert index.counts(ids).tolist() == [2]
+    assert index.products(ids).tolist() == [123 * 45]
+
+
+def test_adjacent_at_edges():
+    grid = Grid.from_lines(["*.12", "3..*", "..4*"])
+    index = NumberIndex(grid)
+    stars = np.flatnonzero(grid.mask("*"))
+    ids = index.adjacent(stars)
+    # The corner star only reaches 3 below it, the border around the grid holds no numbers
+    assert index.counts(ids).tolist() == [1, 2, 1]
+    assert index.products(ids).tolist() == [3, 12 * 4, 4]
+
+
+def test_adjacent_none():
+    grid = Grid.from_lines(["1...", "...*"])
+    index = NumberIndex(grid)
+    ids = index.adjacent([grid.index(3, 1)])
+    assert index.counts(ids).tolist() == [0]
+    assert index.products(ids).tolist() == [1]